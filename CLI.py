@@ -3,19 +3,16 @@ Kanban System - Enhanced Menu Module
 Refactored with improved architecture, error handling, and maintainability
 """
 
+import re
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any, List, Callable
+from datetime import date
+from typing import Optional, Dict, Any, List, Callable, Tuple, FrozenSet
 
-# Import modules with better error handling
-try:
-    import DataStructures
-    import Database
-    import KanbanInfoDatabase as kdb
-except ImportError as e:
-    print(f"Error importing required modules: {e}")
-    sys.exit(1)
+# DataStructures and Database are imported where they are
+# first needed so that the menus come up without loading the storage layer
 
 
 class MenuConfig:
@@ -34,7 +31,7 @@ Choose an option by number:
   7) Advice
   h) Help
   0) Exit
-"""
+""".strip()
 
     ADMIN_MENU_SCREENS = """
 Kanban - Administrative Menu
@@ -43,7 +40,7 @@ Choose an option by number:
   2) Access Kanban system
   h) Help
   0) Exit
-"""
+""".strip()
 
     HELP_TEXTS = {
         'main': "Quick help: Please read the user manual!",
@@ -52,30 +49,66 @@ Choose an option by number:
     
     # Validation constants
     MIN_PASSWORD_LENGTH = 8
-    STATUS_OPTIONS = {
-        1: "To-Do",
-        2: "In Progress", 
-        3: "Waiting Review",
-        4: "Finished"
-    }
+    DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+    # Indexed by the status number shown in prompts; slot 0 is unused
+    STATUS_TUPLE = (None, "To-Do", "In Progress", "Waiting Review", "Finished")
+    # Keyed by the raw prompt text so no int() conversion is needed
+    STATUS_BY_INPUT = {str(num): name for num, name in enumerate(STATUS_TUPLE) if name}
+    STATUS_PROMPT_BASE = "New status (1:To-Do 2:In Progress 3:Waiting Review 4:Finished"
+    
+    # Advice thresholds
+    WORKLOAD_BALANCE = 3  # tasks per person above/below which advice is given
+    BACKLOG_THRESHOLD = 10  # tasks in one status above which advice is given
+    STATUS_ADVICE = (
+        ("to-do", "Do more tasks!"),
+        ("in progress", "Work hard!"),
+        ("waiting review", "Review tasks!")
+    )
+    
+    # User lookup cache
+    USER_CACHE_SIZE = 512
+    USER_CACHE_TTL = 600  # seconds
+    
+    # Show-task cache; other sessions may edit tasks, so entries expire quickly
+    TASK_CACHE_SIZE = 256
+    TASK_CACHE_TTL = 30  # seconds
 
 
 class InputHandler:
     """Unified input handling with validation and error recovery"""
     
+    # input() flushes both stdout and stderr on every call, so prompts are
+    # written and read directly; only a human at a terminal needs the flush
+    INTERACTIVE = sys.stdin is not None and sys.stdin.isatty()
+    
+    @staticmethod
+    def read_line(prompt: str = "") -> str:
+        """Read one line of user input, mirroring input() semantics"""
+        if prompt:
+            sys.stdout.write(prompt)
+            # Line-buffered terminal output already flushes on a newline
+            if InputHandler.INTERACTIVE and not prompt.endswith("\n"):
+                sys.stdout.flush()
+        
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line[:-1] if line.endswith("\n") else line
+    
     @staticmethod
     def get_integer_input(prompt: str, error_message: str = "Please enter a valid number") -> Optional[int]:
         """Safely get integer input with error handling"""
         try:
-            return int(input(prompt).strip())
+            return int(InputHandler.read_line(prompt).strip())
         except (ValueError, TypeError):
             print(error_message)
             return None
     
     @staticmethod
-    def get_choice_input(valid_choices: List[str], case_sensitive: bool = False) -> str:
+    def get_choice_input(valid_choices: FrozenSet[str], case_sensitive: bool = False,
+                         prompt: str = "> ") -> str:
         """Get menu choice with validation"""
-        choice = input("> ").strip()
+        choice = InputHandler.read_line(prompt).strip()
         if not case_sensitive:
             choice = choice.lower()
         return choice if choice in valid_choices else ""
@@ -83,7 +116,7 @@ class InputHandler:
     @staticmethod
     def confirm_action(message: str) -> bool:
         """Get confirmation from user"""
-        response = input(f"{message} (y/N): ").strip().lower()
+        response = InputHandler.read_line(f"{message} (y/N): ").strip().lower()
         return response == 'y'
 
 
@@ -94,48 +127,146 @@ class UserInputValidator:
     def validate_phone_number(phone_input: str) -> Optional[int]:
         """Validate and convert phone number input"""
         cleaned = phone_input.strip()
-        if not cleaned.isdigit() or len(cleaned) < 10:
-            print("Please enter a valid phone number (digits only, min 10 characters)")
-            return None
-        return int(cleaned)
+        # int() does the digit scan; it also accepts a sign or underscores,
+        # which are not valid in a phone number
+        if len(cleaned) >= 10 and cleaned[0] not in "+-" and "_" not in cleaned:
+            try:
+                return int(cleaned)
+            except ValueError:
+                pass
+        print("Please enter a valid phone number (digits only, min 10 characters)")
+        return None
     
     @staticmethod
-    def validate_date(date_str: str) -> Optional[str]:
+    def validate_date(date_str: str, today: Optional[date] = None) -> Optional[str]:
         """Validate date format and ensure it's not in the past"""
+        # fromisoformat alone also accepts forms like YYYYMMDD, so check the shape first
+        if not MenuConfig.DATE_PATTERN.fullmatch(date_str):
+            print("Invalid date format. Please use YYYY-MM-DD")
+            return None
+        
         try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if date_obj < datetime.today().date():
-                print("Date cannot be in the past")
-                return None
-            return date_str
+            date_obj = date.fromisoformat(date_str)
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD")
             return None
+        
+        if date_obj < (today or date.today()):
+            print("Date cannot be in the past")
+            return None
+        return date_str
     
     @staticmethod
     def validate_user_exists(phone_number: int, user_type: str = "user") -> bool:
         """Check if a user exists in the system"""
-        if not kdb.CheckUserExist(phone_number):
+        if UserInputValidator.lookup_user(phone_number) is None:
             print(f"{user_type.capitalize()} does not exist in the system")
             return False
         return True
-
-
-class MenuCommand:
-    """Command pattern implementation for menu actions"""
     
-    def __init__(self, name: str, handler: Callable, requires_auth: bool = True):
-        self.name = name
-        self.handler = handler
-        self.requires_auth = requires_auth
+    # phone number -> (expiry on the monotonic clock, GetUserByPhone row); found users only
+    _user_cache: Dict[int, Tuple[float, Any]] = {}
+    
+    @staticmethod
+    def lookup_user(phone_number: int):
+        """Cached user lookup keyed on phone number; None if the user does not exist"""
+        cache = UserInputValidator._user_cache
+        now = time.monotonic()
+        
+        cached = cache.get(phone_number)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        import Database
+        user_row = Database.GetUserByPhone(phone_number)
+        
+        # Misses are not cached, so users registered elsewhere are found right away
+        if user_row is not None:
+            if len(cache) >= MenuConfig.USER_CACHE_SIZE:
+                cache.clear()
+            cache[phone_number] = (now + MenuConfig.USER_CACHE_TTL, user_row)
+        return user_row
     
-    def execute(self, *args, **kwargs):
-        """Execute the command with error handling"""
+    @staticmethod
+    def clear_user_cache():
+        """Invalidate cached user lookups after user data changes"""
+        UserInputValidator._user_cache.clear()
+
+
+# Input prompts shared by KanbanMenuSystem and the legacy Handle* functions
+def _get_person_input_impl(field_name: str, mandatory: bool = True,
+                           default: Optional[str] = None) -> Optional[int]:
+    """Get validated person input (phone number)"""
+    while True:
         try:
-            return self.handler(*args, **kwargs)
+            input_value = InputHandler.read_line(f"{field_name}: ").strip() or None
+
+            if not input_value:
+                if not mandatory:
+                    return default
+                print(f"{field_name} cannot be empty.")
+                continue
+
+            phone_number = UserInputValidator.validate_phone_number(input_value)
+            if phone_number is None:
+                continue
+
+            if not UserInputValidator.validate_user_exists(phone_number, field_name.lower()):
+                continue
+
+            user_info = UserInputValidator.lookup_user(phone_number)
+            print(f"{field_name}: {user_info}")
+            return phone_number
+
         except Exception as e:
-            print(f"Error executing {self.name}: {e}")
-            return False
+            print(f"Error processing {field_name.lower()} input: {e}")
+            return None
+
+
+@lru_cache(maxsize=None)
+def _status_prompt(additional_text: str = "") -> str:
+    """Build the status prompt once per distinct additional text"""
+    suffix = f" {additional_text}" if additional_text else ""
+    return MenuConfig.STATUS_PROMPT_BASE + suffix + "): "
+
+
+def _get_status_input_impl(mandatory: bool = True,
+                           additional_text: str = "") -> Optional[str]:
+    """Get validated status input"""
+    prompt = _status_prompt(additional_text)
+
+    while True:
+        status_input = InputHandler.read_line(prompt).strip()
+
+        if not status_input:
+            if not mandatory:
+                return None
+            print("Status cannot be empty.")
+            continue
+
+        status = MenuConfig.STATUS_BY_INPUT.get(status_input)
+        if status is not None:
+            return status
+
+        print("Invalid status. Please choose 1-4.")
+
+
+def _get_due_date_input_impl(mandatory: bool = True,
+                             default: Optional[str] = None) -> Optional[str]:
+    """Get validated due date input"""
+    today = date.today()
+    while True:
+        due_date_input = InputHandler.read_line("Due date (YYYY-MM-DD): ").strip() or None
+
+        if not due_date_input:
+            if not mandatory:
+                return default
+            print("Due date cannot be empty.")
+            continue
+
+        validated_date = UserInputValidator.validate_date(due_date_input, today)
+        if validated_date:
+            return validated_date
 
 
 class KanbanMenuSystem:
@@ -143,65 +274,90 @@ class KanbanMenuSystem:
     
     def __init__(self, data_store: str):
         self.store_path = Path(data_store)
-        self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        self.board = DataStructures.KanbanBoard()
+        if data_store:
+            parent = self.store_path.parent
+            if not parent.exists():
+                parent.mkdir(parents=True, exist_ok=True)
+        self._board = None
         self.input_handler = InputHandler()
         self.validator = UserInputValidator()
         
+        # Cached (task_counts, person_counts) for the advice screen;
+        # reset by _board_changed() whenever a command changes the board
+        self._advice_cache: Optional[Tuple[List[int], Dict[str, int]]] = None
+        # Task ID -> (expiry on the monotonic clock, Task) for the show screen
+        self._task_cache: Dict[int, Tuple[float, Any]] = {}
+        
         # Initialize menu commands
         self.main_commands = self._initialize_main_commands()
         self.admin_commands = self._initialize_admin_commands()
-    
-    def _initialize_main_commands(self) -> Dict[str, MenuCommand]:
+        self._main_choices = frozenset(self.main_commands)
+        self._admin_choices = frozenset(self.admin_commands)
+    
+    @property
+    def board(self):
+        """Kanban board, created on first use so admin-only sessions skip it"""
+        if self._board is None:
+            import DataStructures
+            self._board = DataStructures.KanbanBoard()
+        return self._board
+    
+    def _initialize_main_commands(self) -> Dict[str, Callable[[], Any]]:
         """Initialize main menu command mappings"""
         return {
-            '0': MenuCommand("Exit", self._exit_system, requires_auth=False),
-            '1': MenuCommand("List tasks", self._list_tasks),
-            '2': MenuCommand("Add task", self._add_task),
-            '3': MenuCommand("Move task", self._move_task),
-            '4': MenuCommand("Edit task", self._edit_task),
-            '5': MenuCommand("Delete task", self._delete_task),
-            '6': MenuCommand("Show task", self._show_task),
-            '7': MenuCommand("Advice", self._provide_advice),
-            'h': MenuCommand("Help", self._show_help, requires_auth=False)
+            '0': self._exit_system,
+            '1': self._list_tasks,
+            '2': self._add_task,
+            '3': self._move_task,
+            '4': self._edit_task,
+            '5': self._delete_task,
+            '6': self._show_task,
+            '7': self._provide_advice,
+            'h': self._show_help
         }
     
-    def _initialize_admin_commands(self) -> Dict[str, MenuCommand]:
+    def _initialize_admin_commands(self) -> Dict[str, Callable[[], Any]]:
         """Initialize admin menu command mappings"""
         return {
-            '0': MenuCommand("Exit", self._exit_system, requires_auth=False),
-            '1': MenuCommand("Update user status", self._update_user_status),
-            '2': MenuCommand("Access Kanban", lambda: self.run_main_menu()),
-            'h': MenuCommand("Help", self._show_admin_help, requires_auth=False)
+            '0': self._exit_system,
+            '1': self._update_user_status,
+            '2': self.run_main_menu,
+            'h': self._show_admin_help
         }
     
     def run_main_menu(self):
         """Main menu interaction loop"""
-        while True:
-            print(MenuConfig.MENU_SCREENS.strip())
-            choice = self.input_handler.get_choice_input(list(self.main_commands.keys()))
-            
-            if not choice:
-                print("Invalid choice. Please select from the menu.")
-                continue
-            
-            command = self.main_commands[choice]
-            if command.execute() is False and choice == '0':
-                break  # Exit condition
+        self._run_menu(MenuConfig.MENU_SCREENS, self.main_commands, self._main_choices)
     
     def run_admin_menu(self):
         """Admin menu interaction loop"""
+        self._run_menu(MenuConfig.ADMIN_MENU_SCREENS, self.admin_commands, self._admin_choices)
+    
+    def _run_menu(self, screen: str, commands: Dict[str, Callable[[], Any]],
+                  choices: FrozenSet[str]):
+        """Dispatch menu choices until the exit command is chosen"""
+        if not self.input_handler.INTERACTIVE:
+            # Scripted input: one choice per line, no menu screen or prompt
+            for raw in sys.stdin:
+                choice = raw.strip().lower()
+                handler = commands.get(choice)
+                if handler is None:
+                    continue
+                if handler() is False and choice == '0':
+                    break
+            return
+        
+        # Menu screen and choice prompt go out in a single write
+        menu_prompt = screen + "\n> "
         while True:
-            print(MenuConfig.ADMIN_MENU_SCREENS.strip())
-            choice = self.input_handler.get_choice_input(list(self.admin_commands.keys()))
+            choice = self.input_handler.get_choice_input(choices, prompt=menu_prompt)
             
             if not choice:
                 print("Invalid choice. Please select from the menu.")
                 continue
             
-            command = self.admin_commands[choice]
-            if command.execute() is False and choice == '0':
-                break
+            if commands[choice]() is False and choice == '0':
+                break  # Exit condition
     
     # Command implementations with improved error handling
     def _exit_system(self) -> bool:
@@ -222,7 +378,7 @@ class KanbanMenuSystem:
         """Add a new task with comprehensive validation"""
         try:
             # Title validation
-            title = input("Title: ").strip()
+            title = self.input_handler.read_line("Title: ").strip()
             if not title:
                 print("Title cannot be empty.")
                 return False
@@ -232,10 +388,11 @@ class KanbanMenuSystem:
             person_in_charge = self._get_person_input("Person in charge", mandatory=True)
             due_date = self._get_due_date_input(mandatory=False)
             creator = self._get_person_input("Creator", mandatory=True)
-            additional_info = input("Additional information: ").strip()
+            additional_info = self.input_handler.read_line("Additional information: ").strip()
             
             if all([status, person_in_charge, creator]):
                 self.board.AddTask(title, status, person_in_charge, due_date, creator, additional_info)
+                self._board_changed()
                 return True
             return False
             
@@ -253,7 +410,12 @@ class KanbanMenuSystem:
         status = self._get_status_input(mandatory=False, additional_text="Blank: Cancel")
         
         if editor and status:
-            self.board.EditTask(task_id, editor, NewStatus=status)
+            try:
+                self.board.EditTask(task_id, editor, NewStatus=status)
+            except Exception as e:
+                print(f"Error moving task: {e}")
+                return False
+            self._board_changed()
             return True
         return False
     
@@ -269,7 +431,7 @@ class KanbanMenuSystem:
         
         # Collect partial updates
         updates = {}
-        title = input("New title (blank to skip): ").strip()
+        title = self.input_handler.read_line("New title (blank to skip): ").strip()
         if title:
             updates['NewTitle'] = title
         
@@ -285,12 +447,17 @@ class KanbanMenuSystem:
         if due_date:
             updates['NewDueDate'] = due_date
         
-        additional_info = input("New additional information (blank to skip): ").strip()
+        additional_info = self.input_handler.read_line("New additional information (blank to skip): ").strip()
         if additional_info:
             updates['NewAdditionalInfo'] = additional_info
         
         if updates:
-            self.board.EditTask(task_id, editor, **updates)
+            try:
+                self.board.EditTask(task_id, editor, **updates)
+            except Exception as e:
+                print(f"Error editing task: {e}")
+                return False
+            self._board_changed()
             return True
         
         print("No changes specified.")
@@ -298,12 +465,19 @@ class KanbanMenuSystem:
     
     def _delete_task(self) -> bool:
         """Delete one or multiple tasks with confirmation"""
-        task_ids_input = input("Task ID(s) (comma-separated for multiple): ").strip()
+        task_ids_input = self.input_handler.read_line("Task ID(s) (comma-separated for multiple): ").strip()
         task_ids = []
+        seen = set()
         
         for task_id_str in task_ids_input.split(","):
-            task_id = self.input_handler.get_integer_input("", f"Invalid task ID: {task_id_str}")
-            if task_id is not None and task_id not in task_ids:
+            task_id_str = task_id_str.strip()
+            try:
+                task_id = int(task_id_str)
+            except ValueError:
+                print(f"Invalid task ID: {task_id_str}")
+                continue
+            if task_id not in seen:
+                seen.add(task_id)
                 task_ids.append(task_id)
         
         if not task_ids:
@@ -317,8 +491,18 @@ class KanbanMenuSystem:
             message = f"Confirm removal of Tasks {', '.join(map(str, task_ids))}?"
         
         if self.input_handler.confirm_action(message):
-            for task_id in task_ids:
-                self.board.DelTask(task_id)
+            try:
+                result = self.board.delete_tasks(task_ids)
+            except Exception as e:
+                print(f"Error deleting tasks: {e}")
+                return False
+            
+            if not result['success']:
+                print(f"Error deleting tasks: {result['error']}")
+                return False
+            
+            self._board_changed()
+            print(f"{result['deleted_count']} of {len(task_ids)} task(s) deleted.")
             return True
         
         print("Deletion cancelled.")
@@ -331,33 +515,57 @@ class KanbanMenuSystem:
             return False
         
         try:
-            task_data = kdb.GetTaskByID(task_id)
-            if not task_data:
+            task = self._get_task(task_id)
+            if task is None:
                 print("Task not found.")
                 return False
             
-            # Reconstruct task object from database data
-            task = DataStructures.Task(
-                task_data[1], task_data[2], task_data[3], task_data[5], 
-                task_data[6], task_data[8], task_data[4], task_data[7], task_data[0]
-            )
-            task.DisplayTask()
+            print(task.display())
             return True
             
-        except (IndexError, TypeError) as e:
+        except Exception as e:
             print(f"Error displaying task: {e}")
             return False
     
+    def _get_task(self, task_id: int):
+        """Cached GetTaskByID lookup returning a Task, or None if not found"""
+        now = time.monotonic()
+        cached = self._task_cache.get(task_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        import DataStructures
+        import Database
+        task_data = Database.GetTaskByID(task_id)
+        if not task_data:
+            return None  # Not cached: the task may be created by another process
+        
+        task = DataStructures.Task.from_row(task_data)
+        if len(self._task_cache) >= MenuConfig.TASK_CACHE_SIZE:
+            self._task_cache.clear()
+        self._task_cache[task_id] = (now + MenuConfig.TASK_CACHE_TTL, task)
+        return task
+    
+    def _board_changed(self):
+        """Drop cached board data after a command modifies tasks"""
+        self._advice_cache = None
+        self._task_cache.clear()
+    
     def _provide_advice(self) -> bool:
         """Provide system advice based on current state"""
         try:
-            task_counts = kdb.CountTask()
-            person_counts = kdb.CountTaskByPerson()
+            if self._advice_cache is None:
+                import Database
+                self._advice_cache = Database.GetAdvice()
+            task_counts, person_counts = self._advice_cache
             
-            self._display_advice_header()
-            self._display_status_advice(task_counts)
-            self._display_workload_advice(person_counts)
-            self._display_advice_footer()
+            # Collect the whole report and emit it with a single write
+            out: List[str] = []
+            self._display_advice_header(out)
+            self._display_status_advice(out, task_counts)
+            self._display_workload_advice(out, person_counts)
+            self._display_advice_footer(out)
+            sys.stdout.write("\n".join(out) + "\n")
             return True
             
         except Exception as e:
@@ -366,35 +574,51 @@ class KanbanMenuSystem:
     
     def _update_user_status(self) -> bool:
         """Update user activation status (admin function)"""
-        phone_input = input("Phone number: ").strip()
+        phone_input = self.input_handler.read_line("Phone number: ").strip()
         phone_number = self.validator.validate_phone_number(phone_input)
         
-        if phone_number is None or not self.validator.validate_user_exists(phone_number, "user"):
+        if phone_number is None:
             return False
         
-        # Display current user info
-        user_info = Database.GetUserByPhone(phone_number)
-        print("Current user information:")
-        print(user_info)
-        
-        # Get activation status
-        is_active = self.input_handler.get_integer_input(
-            "Set activation status (1 for active, 0 for inactive): "
-        )
-        
-        if is_active not in [0, 1]:
-            print("Invalid status. Please enter 0 or 1.")
+        try:
+            import Database
+            
+            # One lookup both confirms the user exists and supplies the display info;
+            # deactivated users must be found too so they can be reactivated
+            user_info = Database.GetUserInfo(phone_number)
+            if user_info is None:
+                print("User does not exist in the system")
+                return False
+            
+            print("Current user information:")
+            print(user_info)
+            
+            # Get activation status
+            is_active = self.input_handler.get_integer_input(
+                "Set activation status (1 for active, 0 for inactive): "
+            )
+            
+            if is_active not in [0, 1]:
+                print("Invalid status. Please enter 0 or 1.")
+                return False
+            
+            # Update status; False means the user already had this status
+            if not Database.ChangeActivationStatus(phone_number, is_active):
+                print("User status unchanged.")
+                return True
+            
+            self.validator.clear_user_cache()
+            print("User status updated successfully.")
+            
+            # Display updated info
+            updated_info = Database.GetUserInfo(phone_number)
+            print("Updated user information:")
+            print(updated_info)
+            return True
+            
+        except Exception as e:
+            print(f"Error updating user status: {e}")
             return False
-        
-        # Update status
-        Database.ChangeActivationStatus(phone_number, is_active)
-        print("User status updated successfully.")
-        
-        # Display updated info
-        updated_info = Database.GetUserByPhone(phone_number)
-        print("Updated user information:")
-        print(updated_info)
-        return True
     
     def _show_help(self) -> bool:
         """Display help information"""
@@ -410,121 +634,63 @@ class KanbanMenuSystem:
     def _get_person_input(self, field_name: str, mandatory: bool = True, 
                          default: Optional[str] = None) -> Optional[int]:
         """Get validated person input (phone number)"""
-        while True:
-            try:
-                input_value = input(f"{field_name}: ").strip() or None
-                
-                if not input_value:
-                    if not mandatory:
-                        return default
-                    print(f"{field_name} cannot be empty.")
-                    continue
-                
-                phone_number = self.validator.validate_phone_number(input_value)
-                if phone_number is None:
-                    continue
-                
-                if not self.validator.validate_user_exists(phone_number, field_name.lower()):
-                    continue
-                
-                user_info = kdb.GetUserByPhone(phone_number)
-                print(f"{field_name}: {user_info}")
-                return phone_number
-                
-            except Exception as e:
-                print(f"Error processing {field_name.lower()} input: {e}")
-                return None
+        return _get_person_input_impl(field_name, mandatory, default)
     
     def _get_status_input(self, mandatory: bool = True, 
                          additional_text: str = "") -> Optional[str]:
         """Get validated status input"""
-        prompt = "New status (1:To-Do 2:In Progress 3:Waiting Review 4:Finished"
-        if additional_text:
-            prompt += f" {additional_text}"
-        prompt += "): "
-        
-        while True:
-            status_input = input(prompt).strip()
-            
-            if not status_input:
-                if not mandatory:
-                    return None
-                print("Status cannot be empty.")
-                continue
-            
-            status_num = self.input_handler.get_integer_input("", "Invalid status number")
-            if status_num is None:
-                continue
-            
-            if status_num in MenuConfig.STATUS_OPTIONS:
-                return MenuConfig.STATUS_OPTIONS[status_num]
-            
-            print("Invalid status. Please choose 1-4.")
+        return _get_status_input_impl(mandatory, additional_text)
     
     def _get_due_date_input(self, mandatory: bool = True, 
                            default: Optional[str] = None) -> Optional[str]:
         """Get validated due date input"""
-        while True:
-            due_date_input = input("Due date (YYYY-MM-DD): ").strip() or None
-            
-            if not due_date_input:
-                if not mandatory:
-                    return default
-                print("Due date cannot be empty.")
-                continue
-            
-            validated_date = self.validator.validate_date(due_date_input)
-            if validated_date:
-                return validated_date
+        return _get_due_date_input_impl(mandatory, default)
     
     # Advice display helpers
-    def _display_advice_header(self):
-        """Display advice section header"""
-        print("\n" + "-" * 50)
-        print(f"{'Advice':^50}")
-        print("-" * 50)
-    
-    def _display_status_advice(self, task_counts: List[int]):
-        """Display advice based on task status counts"""
-        status_names = ["To-Do", "In Progress", "Waiting Review"]
+    def _display_advice_header(self, out: List[str]):
+        """Add advice section header lines to out"""
+        out.extend(("", "-" * 50, f"{'Advice':^50}", "-" * 50))
+    
+    def _display_status_advice(self, out: List[str], task_counts: List[int]):
+        """Add advice based on task status counts to out"""
         advice_given = False
         
-        for i, count in enumerate(task_counts[:3]):  # First three statuses
-            if count > 10:
-                messages = [
-                    "Do more tasks!",
-                    "Work hard!",
-                    "Review tasks!"
-                ]
-                print(f"Attention: {messages[i]} There are {count} {status_names[i].lower()} tasks!")
+        # zip stops after the three advised statuses; Finished is never flagged
+        for (name, message), count in zip(MenuConfig.STATUS_ADVICE, task_counts):
+            if count > MenuConfig.BACKLOG_THRESHOLD:
+                out.append(f"Attention: {message} There are {count} {name} tasks!")
                 advice_given = True
         
         if not advice_given:
-            print("No further advice for task status. Keep going!")
+            out.append("No further advice for task status. Keep going!")
     
-    def _display_workload_advice(self, person_counts: Dict[str, int]):
-        """Display advice based on person workload"""
-        print("-" * 50)
+    def _display_workload_advice(self, out: List[str], person_counts: Dict[str, int]):
+        """Add advice based on person workload to out"""
+        out.append("-" * 50)
         
-        overloaded = [f"{person} ({count} tasks)" 
-                     for person, count in person_counts.items() if count > 3]
-        underloaded = [f"{person} ({count} task(s))" 
-                      for person, count in person_counts.items() if count < 3]
+        balance = MenuConfig.WORKLOAD_BALANCE
+        overloaded, underloaded = [], []
+        for person, count in person_counts.items():
+            if count > balance:
+                overloaded.append(f"{person} ({count} tasks)")
+            elif count < balance:
+                underloaded.append(f"{person} ({count} task(s))")
         
         if overloaded:
-            print(f"Attention: Too much work for {', '.join(overloaded)}!")
-            print("           Try to redistribute tasks!\n")
+            out.append(f"Attention: Too much work for {', '.join(overloaded)}!")
+            out.append("           Try to redistribute tasks!")
+            out.append("")
         else:
-            print("No one is overloaded. Keep going!")
+            out.append("No one is overloaded. Keep going!")
         
         if underloaded:
-            print(f"Attention: Try to give some tasks to {', '.join(underloaded)}!")
+            out.append(f"Attention: Try to give some tasks to {', '.join(underloaded)}!")
         else:
-            print("Attention: No one is available for more tasks!")
+            out.append("Attention: No one is available for more tasks!")
     
-    def _display_advice_footer(self):
-        """Display advice section footer"""
-        print("\n" + "-" * 50)
+    def _display_advice_footer(self, out: List[str]):
+        """Add advice section footer lines to out"""
+        out.extend(("", "-" * 50))
 
 
 def interactive_menu(store: str):
@@ -541,28 +707,23 @@ def InteractiveMenuAdmin(store: str):
 
 # Maintain legacy function interfaces for backward compatibility
 def HandlePersonInChargeInput(Mandatory=True, DefaultResponse="Undecided"):
-    menu_system = KanbanMenuSystem("")
-    return menu_system._get_person_input("Person in charge", Mandatory, DefaultResponse)
+    return _get_person_input_impl("Person in charge", Mandatory, DefaultResponse)
 
 
 def HandleCreatorInput(Mandatory=True, DefaultResponse="Unknown"):
-    menu_system = KanbanMenuSystem("")
-    return menu_system._get_person_input("Creator", Mandatory, DefaultResponse)
+    return _get_person_input_impl("Creator", Mandatory, DefaultResponse)
 
 
 def HandleEditorInput(Mandatory=True, DefaultResponse="Unknown"):
-    menu_system = KanbanMenuSystem("")
-    return menu_system._get_person_input("Editor", Mandatory, DefaultResponse)
+    return _get_person_input_impl("Editor", Mandatory, DefaultResponse)
 
 
 def HandleStatusInput(Mandatory=True, AdditionalText=""):
-    menu_system = KanbanMenuSystem("")
-    return menu_system._get_status_input(Mandatory, AdditionalText)
+    return _get_status_input_impl(Mandatory, AdditionalText)
 
 
 def HandleDueDateInput(Mandatory=True, DefaultResponse=None):
-    menu_system = KanbanMenuSystem("")
-    return menu_system._get_due_date_input(Mandatory, DefaultResponse)
+    return _get_due_date_input_impl(Mandatory, DefaultResponse)
 
 
 # Main execution block
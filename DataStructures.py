@@ -4,11 +4,11 @@ Enhanced Kanban System - Simplified Business Logic Layer
 Clean, efficient task management with improved architecture
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from dataclasses import dataclass
 import logging
+import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -25,58 +25,125 @@ class TaskStatus(Enum):
     @classmethod
     def get_all_statuses(cls) -> List[str]:
         """Get all valid status values"""
-        return [status.value for status in cls]
+        return list(_ALL_STATUSES)
+
+
+# Status values resolved once at import
+_ALL_STATUSES = tuple(status.value for status in TaskStatus)
+_VALID_STATUSES = frozenset(_ALL_STATUSES)
+
+# Fixed display_board lines
+_BOARD_RULE = "=" * 50
+_BOARD_TITLE = f"{'KANBAN BOARD':^50}"
+_SECTION_RULE = "-" * 50
+_STATUS_HEADERS = {status: f"\n{status.upper():^50}" for status in _ALL_STATUSES}
+
+
+def _due_ordinal(due_date: str) -> int:
+    """Convert a YYYY-MM-DD due date to a date ordinal (sys.maxsize if invalid)"""
+    # fromisoformat skips strptime's format parsing; the length check keeps
+    # it from accepting compact forms such as YYYYMMDD
+    if len(due_date) != 10:
+        return sys.maxsize
+    try:
+        return date.fromisoformat(due_date).toordinal()
+    except ValueError:
+        return sys.maxsize
+
+
+# Public Task fields, in constructor order; used for repr and equality
+_TASK_FIELDS = ('task_id', 'title', 'status', 'person_in_charge', 'creation_date',
+                'due_date', 'creator', 'editors', 'additional_info')
 
 
-@dataclass
 class Task:
     """Simplified Task data model with core functionality"""
     
-    task_id: Optional[int] = None
-    title: str = ""
-    status: str = TaskStatus.TO_DO.value
-    person_in_charge: int = 0
-    creation_date: str = ""
-    due_date: str = ""
-    creator: int = 0
-    editors: Optional[int] = None
-    additional_info: str = ""
-    
-    def __post_init__(self):
-        """Initialize creation date if not provided"""
-        if not self.creation_date:
-            self.creation_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # _due_ord holds (due_date, ordinal) so overdue checks are a single int comparison
+    __slots__ = _TASK_FIELDS + ('_due_ord',)
+    __hash__ = None  # mutable and compared by value
+    
+    def __init__(self, task_id: Optional[int] = None, title: str = "",
+                 status: str = TaskStatus.TO_DO.value, person_in_charge: int = 0,
+                 creation_date: str = "", due_date: str = "", creator: int = 0,
+                 editors: Optional[int] = None, additional_info: str = ""):
+        self.task_id = task_id
+        self.title = title
+        self.status = status
+        self.person_in_charge = person_in_charge
+        # Only read the clock when the caller has no creation date
+        self.creation_date = creation_date or datetime.now().isoformat(sep=" ", timespec="seconds")
+        self.due_date = due_date
+        self.creator = creator
+        self.editors = editors
+        self.additional_info = additional_info
+        self._due_ord = None
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _TASK_FIELDS)
+        return f"Task({fields})"
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _TASK_FIELDS)
+    
+    @classmethod
+    def from_row(cls, row) -> 'Task':
+        """Create Task from a legacy GetTaskByID record
+        (ID, Title, Status, PersonInCharge, CreationDate, DueDate, Creator, Editors, AdditionalInfo)"""
+        (task_id, title, status, person_in_charge, creation_date,
+         due_date, creator, editors, additional_info) = row
+        return cls(
+            task_id=task_id,
+            title=title,
+            status=status,
+            person_in_charge=person_in_charge,
+            creation_date=creation_date,
+            due_date=due_date or "",
+            creator=creator,
+            editors=editors,
+            additional_info=additional_info or ""
+        )
     
     def validate(self) -> List[str]:
         """Basic task validation"""
         errors = []
+        title = self.title.strip() if self.title else ""
         
-        if not self.title or not self.title.strip():
+        if not title:
             errors.append("Task title cannot be empty")
-        
-        if self.title and len(self.title.strip()) > 200:
+        elif len(title) > 200:
             errors.append("Task title cannot exceed 200 characters")
         
-        if self.status not in TaskStatus.get_all_statuses():
+        if self.status not in _VALID_STATUSES:
             errors.append(f"Invalid status: {self.status}")
         
-        if not isinstance(self.person_in_charge, int) or self.person_in_charge <= 0:
+        if type(self.person_in_charge) is not int or self.person_in_charge <= 0:
             errors.append("Person in charge must be a positive integer")
         
-        if not isinstance(self.creator, int) or self.creator <= 0:
+        if type(self.creator) is not int or self.creator <= 0:
             errors.append("Creator must be a positive integer")
         
         return errors
     
-    def is_overdue(self) -> bool:
+    def due_ordinal(self) -> int:
+        """Due date as a date ordinal, recomputed only when due_date changes"""
+        cached = self._due_ord
+        if cached is not None and cached[0] == self.due_date:
+            return cached[1]
+        
+        ordinal = _due_ordinal(self.due_date)
+        self._due_ord = (self.due_date, ordinal)
+        return ordinal
+    
+    def is_overdue(self, today: Optional[date] = None) -> bool:
         """Check if task is overdue"""
-        try:
-            due = datetime.strptime(self.due_date, "%Y-%m-%d").date()
-            return due < datetime.now().date()
-        except ValueError:
-            return False
+        if today is None:
+            today = date.today()
+        return self.due_ordinal() < today.toordinal()
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, today: Optional[date] = None) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
             'task_id': self.task_id,
@@ -88,7 +155,7 @@ class Task:
             'creator': self.creator,
             'editors': self.editors,
             'additional_info': self.additional_info,
-            'is_overdue': self.is_overdue()
+            'is_overdue': self.is_overdue(today)
         }
     
     def display(self) -> str:
@@ -109,6 +176,14 @@ class TaskRepository:
         """Get all tasks"""
         pass
     
+    def get_tasks_by_status(self, status: str) -> List[Task]:
+        """Get tasks with the given status"""
+        return [task for task in self.get_all_tasks() if task.status == status]
+    
+    def get_overdue_tasks(self, today: date) -> List[Task]:
+        """Get tasks due before today"""
+        return [task for task in self.get_all_tasks() if task.is_overdue(today)]
+    
     def add_task(self, task: Task) -> int:
         """Add new task"""
         pass
@@ -120,6 +195,10 @@ class TaskRepository:
     def delete_task(self, task_id: int) -> bool:
         """Delete task"""
         pass
+    
+    def delete_tasks(self, task_ids: List[int]) -> int:
+        """Delete several tasks at once, returning how many were removed"""
+        pass
 
 
 class UserService:
@@ -128,15 +207,21 @@ class UserService:
     def get_user_display_name(self, user_id: int) -> str:
         """Get user display name"""
         pass
+    
+    def get_user_display_names(self, user_ids: List[int]) -> Dict[int, str]:
+        """Get display names for several users; override to batch the lookup"""
+        return {user_id: self.get_user_display_name(user_id) for user_id in set(user_ids)}
 
 
 class KanbanBoard:
     """Simplified Kanban board with core functionality"""
     
+    # Display order of statuses, shared by all boards; membership checks use _VALID_STATUSES
+    valid_statuses = _ALL_STATUSES
+    
     def __init__(self, task_repo: TaskRepository, user_service: UserService):
         self.task_repo = task_repo
         self.user_service = user_service
-        self.valid_statuses = TaskStatus.get_all_statuses()
     
     def add_task(self, title: str, status: str, person_in_charge: int, 
                  due_date: str, creator: int, additional_info: str = "") -> Dict[str, Any]:
@@ -145,7 +230,7 @@ class KanbanBoard:
         if not title or not title.strip():
             return {'success': False, 'error': 'Task title is required'}
         
-        if status not in self.valid_statuses:
+        if status not in _VALID_STATUSES:
             return {'success': False, 'error': f'Invalid status: {status}'}
         
         # Create and validate task
@@ -165,7 +250,7 @@ class KanbanBoard:
         try:
             # Save to repository
             task_id = self.task_repo.add_task(task)
-            logger.info(f"Task added: {title} (ID: {task_id})")
+            logger.info("Task added: %s (ID: %s)", title, task_id)
             
             return {
                 'success': True,
@@ -174,7 +259,7 @@ class KanbanBoard:
             }
             
         except Exception as e:
-            logger.error(f"Failed to add task: {e}")
+            logger.error("Failed to add task: %s", e)
             return {'success': False, 'error': str(e)}
     
     def get_task(self, task_id: int) -> Dict[str, Any]:
@@ -191,31 +276,32 @@ class KanbanBoard:
             }
             
         except Exception as e:
-            logger.error(f"Error getting task {task_id}: {e}")
+            logger.error("Error getting task %s: %s", task_id, e)
             return {'success': False, 'error': str(e)}
     
     def update_task(self, task_id: int, **updates) -> Dict[str, Any]:
         """Update task fields"""
         try:
             # Validate status if provided
-            if 'status' in updates and updates['status'] not in self.valid_statuses:
+            if 'status' in updates and updates['status'] not in _VALID_STATUSES:
                 return {'success': False, 'error': f'Invalid status: {updates["status"]}'}
             
             # Apply updates
             success = self.task_repo.update_task(task_id, **updates)
             
             if success:
-                logger.info(f"Task {task_id} updated: {list(updates.keys())}")
+                updated_fields = list(updates)
+                logger.info("Task %s updated: %s", task_id, updated_fields)
                 return {
                     'success': True,
                     'message': f'Task {task_id} updated successfully',
-                    'updated_fields': list(updates.keys())
+                    'updated_fields': updated_fields
                 }
             else:
                 return {'success': False, 'error': f'Task {task_id} not found'}
                 
         except Exception as e:
-            logger.error(f"Error updating task {task_id}: {e}")
+            logger.error("Error updating task %s: %s", task_id, e)
             return {'success': False, 'error': str(e)}
     
     def delete_task(self, task_id: int) -> Dict[str, Any]:
@@ -224,13 +310,33 @@ class KanbanBoard:
             success = self.task_repo.delete_task(task_id)
             
             if success:
-                logger.info(f"Task {task_id} deleted")
+                logger.info("Task %s deleted", task_id)
                 return {'success': True, 'message': f'Task {task_id} deleted successfully'}
             else:
                 return {'success': False, 'error': f'Task {task_id} not found'}
                 
         except Exception as e:
-            logger.error(f"Error deleting task {task_id}: {e}")
+            logger.error("Error deleting task %s: %s", task_id, e)
+            return {'success': False, 'error': str(e)}
+    
+    def delete_tasks(self, task_ids: List[int]) -> Dict[str, Any]:
+        """Delete several tasks in a single repository call"""
+        task_ids = list(dict.fromkeys(task_ids))  # Repeated IDs count once
+        try:
+            deleted_count = self.task_repo.delete_tasks(task_ids)
+            logger.info("Deleted %s of %s tasks", deleted_count, len(task_ids))
+            
+            if not deleted_count:
+                return {'success': False, 'deleted_count': 0, 'error': 'No matching tasks found'}
+            
+            return {
+                'success': True,
+                'deleted_count': deleted_count,
+                'message': f'{deleted_count} task(s) deleted successfully'
+            }
+            
+        except Exception as e:
+            logger.error("Error deleting tasks %s: %s", task_ids, e)
             return {'success': False, 'error': str(e)}
     
     def get_all_tasks(self, group_by_status: bool = True) -> Dict[str, Any]:
@@ -239,98 +345,104 @@ class KanbanBoard:
             tasks = self.task_repo.get_all_tasks()
             
             if group_by_status:
-                grouped = self._group_tasks_by_status(tasks)
                 return {
                     'success': True,
-                    'tasks': grouped,
+                    'tasks': self._group_tasks_by_status(tasks),
                     'total_count': len(tasks)
                 }
             else:
+                today = date.today()
                 return {
                     'success': True,
-                    'tasks': [task.to_dict() for task in tasks],
+                    'tasks': [task.to_dict(today) for task in tasks],
                     'total_count': len(tasks)
                 }
                 
         except Exception as e:
-            logger.error(f"Error getting tasks: {e}")
+            logger.error("Error getting tasks: %s", e)
             return {'success': False, 'error': str(e)}
     
     def get_tasks_by_status(self, status: str) -> Dict[str, Any]:
         """Get tasks filtered by status"""
-        if status not in self.valid_statuses:
+        if status not in _VALID_STATUSES:
             return {'success': False, 'error': f'Invalid status: {status}'}
         
         try:
-            all_tasks = self.task_repo.get_all_tasks()
-            filtered_tasks = [task for task in all_tasks if task.status == status]
+            filtered_tasks = self.task_repo.get_tasks_by_status(status)
+            today = date.today()
             
             return {
                 'success': True,
-                'tasks': [task.to_dict() for task in filtered_tasks],
+                'tasks': [task.to_dict(today) for task in filtered_tasks],
                 'status': status,
                 'count': len(filtered_tasks)
             }
             
         except Exception as e:
-            logger.error(f"Error getting tasks by status {status}: {e}")
+            logger.error("Error getting tasks by status %s: %s", status, e)
             return {'success': False, 'error': str(e)}
     
     def get_overdue_tasks(self) -> Dict[str, Any]:
         """Get all overdue tasks"""
         try:
-            all_tasks = self.task_repo.get_all_tasks()
-            overdue_tasks = [task for task in all_tasks if task.is_overdue()]
+            today = date.today()
+            overdue_tasks = self.task_repo.get_overdue_tasks(today)
             
             return {
                 'success': True,
-                'tasks': [task.to_dict() for task in overdue_tasks],
+                'tasks': [task.to_dict(today) for task in overdue_tasks],
                 'count': len(overdue_tasks)
             }
             
         except Exception as e:
-            logger.error(f"Error getting overdue tasks: {e}")
+            logger.error("Error getting overdue tasks: %s", e)
             return {'success': False, 'error': str(e)}
     
     def display_board(self) -> str:
         """Display kanban board in formatted text"""
         try:
-            result = self.get_all_tasks(group_by_status=True)
-            
-            if not result['success']:
-                return "Error displaying board"
-            
-            grouped_tasks = result['tasks']
-            output = []
-            output.append("\n" + "="*50)
-            output.append(f"{'KANBAN BOARD':^50}")
-            output.append("="*50)
+            # is_overdue is computed once per task, against one date, while grouping
+            grouped_tasks = self._group_as_dicts(self.task_repo.get_all_tasks(), date.today())
+            output = ["\n" + _BOARD_RULE, _BOARD_TITLE, _BOARD_RULE]
             
+            # Resolve every assignee in one user service call
+            assignee_names = self.user_service.get_user_display_names(
+                [task['person_in_charge'] for tasks in grouped_tasks.values() for task in tasks]
+            )
             for status in self.valid_statuses:
                 tasks = grouped_tasks.get(status, [])
                 if tasks:
-                    output.append(f"\n{status.upper():^50}")
-                    output.append("-"*50)
+                    output.append(_STATUS_HEADERS[status])
+                    output.append(_SECTION_RULE)
                     for task in tasks:
-                        assignee_name = self.user_service.get_user_display_name(task.person_in_charge)
-                        overdue_indicator = " [OVERDUE]" if task.is_overdue() else ""
-                        output.append(f"#{task.task_id}: {task.title}{overdue_indicator}")
-                        output.append(f"   Due: {task.due_date} | Assignee: {assignee_name}")
+                        assignee_name = assignee_names[task['person_in_charge']]
+                        overdue_indicator = " [OVERDUE]" if task['is_overdue'] else ""
+                        output.append(f"#{task['task_id']}: {task['title']}{overdue_indicator}\n"
+                                      f"   Due: {task['due_date']} | Assignee: {assignee_name}")
             
-            output.append("\n" + "="*50)
+            output.append("\n" + _BOARD_RULE)
             return "\n".join(output)
             
         except Exception as e:
-            logger.error(f"Error displaying board: {e}")
+            logger.error("Error displaying board: %s", e)
             return f"Error displaying board: {e}"
     
+    def _group_as_dicts(self, tasks: List[Task], today: date) -> Dict[str, List[Dict[str, Any]]]:
+        """Group tasks by status as dicts with is_overdue evaluated against today"""
+        return {
+            status: [task.to_dict(today) for task in bucket]
+            for status, bucket in self._group_tasks_by_status(tasks).items()
+        }
+    
     def _group_tasks_by_status(self, tasks: List[Task]) -> Dict[str, List[Task]]:
         """Group tasks by status"""
         grouped = {status: [] for status in self.valid_statuses}
+        appenders = {status: bucket.append for status, bucket in grouped.items()}
         
         for task in tasks:
-            if task.status in grouped:
-                grouped[task.status].append(task)
+            append = appenders.get(task.status)
+            if append is not None:
+                append(task)
         
         return grouped
 
@@ -341,6 +453,8 @@ class InMemoryTaskRepository(TaskRepository):
     
     def __init__(self):
         self.tasks = {}
+        # Status -> {task_id: task}, kept in step with self.tasks
+        self.by_status = {status: {} for status in TaskStatus.get_all_statuses()}
         self.next_id = 1
         
         # Add sample data
@@ -360,9 +474,18 @@ class InMemoryTaskRepository(TaskRepository):
     def get_all_tasks(self) -> List[Task]:
         return list(self.tasks.values())
     
+    def get_tasks_by_status(self, status: str) -> List[Task]:
+        return list(self.by_status.get(status, {}).values())
+    
+    def get_overdue_tasks(self, today: date) -> List[Task]:
+        today_ord = today.toordinal()
+        return [task for task in self.tasks.values() if task.due_ordinal() < today_ord]
+    
     def add_task(self, task: Task) -> int:
         task.task_id = self.next_id
         self.tasks[self.next_id] = task
+        self.by_status.setdefault(task.status, {})[task.task_id] = task
+        task.due_ordinal()  # encode the due date up front
         self.next_id += 1
         return task.task_id
     
@@ -371,29 +494,47 @@ class InMemoryTaskRepository(TaskRepository):
             return False
         
         task = self.tasks[task_id]
+        old_status = task.status
         for key, value in updates.items():
             if hasattr(task, key):
                 setattr(task, key, value)
         
+        if task.status != old_status:
+            self.by_status[old_status].pop(task_id, None)
+            self.by_status.setdefault(task.status, {})[task_id] = task
+        
+        if 'due_date' in updates:
+            task.due_ordinal()
+        
         return True
     
     def delete_task(self, task_id: int) -> bool:
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-            return True
-        return False
+        task = self.tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self.by_status[task.status].pop(task_id, None)
+        return True
+    
+    def delete_tasks(self, task_ids: List[int]) -> int:
+        deleted = 0
+        for task_id in task_ids:
+            if self.delete_task(task_id):
+                deleted += 1
+        return deleted
 
 
 class SimpleUserService(UserService):
     """Simple user service for demonstration"""
     
+    USERS = {
+        1001: "Admin User",
+        1002: "John Developer", 
+        1003: "Jane Tester"
+    }
+    
     def get_user_display_name(self, user_id: int) -> str:
-        users = {
-            1001: "Admin User",
-            1002: "John Developer", 
-            1003: "Jane Tester"
-        }
-        return users.get(user_id, f"User {user_id}")
+        name = self.USERS.get(user_id)
+        return name if name is not None else f"User {user_id}"
 
 
 # Usage example
@@ -5,18 +5,22 @@ Robust database module with improved security, performance, and maintainability
 """
 
 import sqlite3
+import queue
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union, Tuple
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Union, Tuple, Iterator
+from datetime import date, datetime, timezone
 from contextlib import contextmanager
+from functools import lru_cache
 from enum import Enum
 import logging
 from dataclasses import dataclass
 import hashlib
 import re
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Module logger; handlers are configured by the application
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +31,18 @@ class DatabaseConfig:
     DB_PATH = Path("kanban.db")
     DB_BACKUP_DIR = Path("database_backups")
     DEFAULT_TIMEOUT = 30
+    POOL_SIZE = 8  # maximum pooled connections
+    BACKUP_PAGES_PER_STEP = 64  # pages copied per backup step before yielding
+    CACHED_STATEMENTS = 256  # prepared statements kept per connection (sqlite3 default: 128)
+    
+    # Per-connection tuning, run as one script when a pooled connection is opened
+    CONNECTION_PRAGMAS = """
+        PRAGMA foreign_keys = ON;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -64000;      -- 64 MB page cache
+        PRAGMA mmap_size = 268435456;    -- 256 MB memory-mapped I/O
+    """
     
     # Table schemas with enhanced constraints
     KANBAN_TABLE_SCHEMA = """
@@ -50,13 +66,39 @@ class DatabaseConfig:
     """
     
     # Performance indexes
+    # Status and assignee indexes include IsActive so the board filters and the
+    # advice counts are answered from the index alone, already in DueDate order
     TABLE_INDEXES = [
-        "CREATE INDEX IF NOT EXISTS idx_kanban_status ON KANBAN(Status)",
-        "CREATE INDEX IF NOT EXISTS idx_kanban_due_date ON KANBAN(DueDate)",
-        "CREATE INDEX IF NOT EXISTS idx_kanban_person ON KANBAN(PersonInCharge)",
-        "CREATE INDEX IF NOT EXISTS idx_kanban_creator ON KANBAN(Creator)",
-        "CREATE INDEX IF NOT EXISTS idx_kanban_modified ON KANBAN(LastModified)",
-        "CREATE INDEX IF NOT EXISTS idx_kanban_active ON KANBAN(IsActive)"
+        "DROP INDEX IF EXISTS idx_kanban_status",
+        "DROP INDEX IF EXISTS idx_kanban_person",
+        "DROP INDEX IF EXISTS idx_kanban_active",  # two-valued column, never selective
+        "DROP INDEX IF EXISTS idx_kanban_modified",  # no query filters on LastModified
+        "CREATE INDEX IF NOT EXISTS idx_kanban_status_active ON KANBAN(Status, IsActive, DueDate)",
+        "CREATE INDEX IF NOT EXISTS idx_kanban_due_date ON KANBAN(DueDate)",  # overdue range scan
+        "CREATE INDEX IF NOT EXISTS idx_kanban_person_active_due ON KANBAN(PersonInCharge, IsActive, DueDate)",
+        "CREATE INDEX IF NOT EXISTS idx_kanban_creator ON KANBAN(Creator)"  # USER FK cascades
+    ]
+    
+    # Full-text index for search_tasks; the trigram tokenizer keeps LIKE '%term%'
+    # substring semantics while answering from the index
+    SEARCH_INDEX_SCHEMA = [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS kanban_fts USING fts5(
+            Title, AdditionalInfo, content='KANBAN', content_rowid='ID', tokenize='trigram'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS kanban_fts_ai AFTER INSERT ON KANBAN BEGIN
+            INSERT INTO kanban_fts(rowid, Title, AdditionalInfo)
+            VALUES (new.ID, new.Title, new.AdditionalInfo);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS kanban_fts_ad AFTER DELETE ON KANBAN BEGIN
+            INSERT INTO kanban_fts(kanban_fts, rowid, Title, AdditionalInfo)
+            VALUES ('delete', old.ID, old.Title, old.AdditionalInfo);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS kanban_fts_au AFTER UPDATE OF Title, AdditionalInfo ON KANBAN BEGIN
+            INSERT INTO kanban_fts(kanban_fts, rowid, Title, AdditionalInfo)
+            VALUES ('delete', old.ID, old.Title, old.AdditionalInfo);
+            INSERT INTO kanban_fts(rowid, Title, AdditionalInfo)
+            VALUES (new.ID, new.Title, new.AdditionalInfo);
+        END"""
     ]
 
 
@@ -70,15 +112,63 @@ class TaskStatus(Enum):
     @classmethod
     def get_valid_statuses(cls) -> List[str]:
         """Get all valid status values"""
-        return [status.value for status in cls]
+        return list(_ALL_STATUSES)
     
     @classmethod
     def is_valid_status(cls, status: str) -> bool:
         """Check if a status is valid"""
-        return status in cls.get_valid_statuses()
+        return status in _VALID_STATUSES
+
+
+# Built once; TaskStatus members cannot change at runtime
+_ALL_STATUSES = tuple(status.value for status in TaskStatus)
+_VALID_STATUSES = frozenset(_ALL_STATUSES)
+
 
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-@dataclass
+
+def _is_valid_date_format(date_str: str) -> bool:
+    """Check if date string is a real YYYY-MM-DD date without raising"""
+    match = _DATE_RE.fullmatch(date_str) if isinstance(date_str, str) else None
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    if not 1 <= month <= 12 or year < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= _DAYS_IN_MONTH[month - 1]
+
+
+def _task_field_errors(title: str, status: str, person_in_charge: int,
+                       creator: int, due_date: str) -> List[str]:
+    """Validation shared by Task.validate and KanbanRepository.add_task"""
+    errors = []
+    
+    if not title or not title.strip():
+        errors.append("Task title cannot be empty")
+    elif len(title.strip()) > 200:
+        errors.append("Task title cannot exceed 200 characters")
+    
+    if status not in _VALID_STATUSES:
+        valid_statuses = list(_ALL_STATUSES)
+        errors.append(f"Invalid status: {status}. Must be one of {valid_statuses}")
+    
+    if not isinstance(person_in_charge, int) or person_in_charge <= 0:
+        errors.append("Person in charge must be a positive integer")
+    
+    if not isinstance(creator, int) or creator <= 0:
+        errors.append("Creator must be a positive integer")
+    
+    if not _is_valid_date_format(due_date):
+        errors.append("Due date must be in YYYY-MM-DD format")
+    
+    return errors
+
+
+@dataclass(slots=True)
 class Task:
     """Data model representing a Kanban task with validation"""
     
@@ -97,40 +187,15 @@ class Task:
     
     def validate(self) -> List[str]:
         """Validate task data and return list of errors"""
-        errors = []
-        
-        if not self.title or len(self.title.strip()) == 0:
-            errors.append("Task title cannot be empty")
-        elif len(self.title) > 200:
-            errors.append("Task title cannot exceed 200 characters")
-        
-        if not TaskStatus.is_valid_status(self.status):
-            valid_statuses = TaskStatus.get_valid_statuses()
-            errors.append(f"Invalid status: {self.status}. Must be one of {valid_statuses}")
-        
-        if not isinstance(self.person_in_charge, int) or self.person_in_charge <= 0:
-            errors.append("Person in charge must be a positive integer")
-        
-        if not isinstance(self.creator, int) or self.creator <= 0:
-            errors.append("Creator must be a positive integer")
+        errors = _task_field_errors(
+            self.title, self.status, self.person_in_charge, self.creator, self.due_date
+        )
         
         if self.editors is not None and (not isinstance(self.editors, int) or self.editors <= 0):
             errors.append("Editors must be a positive integer or None")
         
-        # Validate date format
-        if not self._is_valid_date_format(self.due_date):
-            errors.append("Due date must be in YYYY-MM-DD format")
-        
         return errors
     
-    def _is_valid_date_format(self, date_str: str) -> bool:
-        """Check if date string is in valid format"""
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
-    
     def to_dict(self, include_sensitive: bool = False) -> Dict[str, Any]:
         """Convert task to dictionary for serialization"""
         data = {
@@ -154,20 +219,23 @@ class Task:
     
     @classmethod
     def from_db_row(cls, row: sqlite3.Row) -> 'Task':
-        """Create Task from database row"""
+        """Create Task from a database row selected with _TASK_SELECT"""
+        # Positional unpacking is cheaper than twelve lookups by column name
+        (task_id, title, status, person_in_charge, creation_date, due_date,
+         creator, editors, additional_info, last_modified, version, is_active) = row
         return cls(
-            task_id=row['ID'],
-            title=row['Title'],
-            status=row['Status'],
-            person_in_charge=row['PersonInCharge'],
-            due_date=row['DueDate'],
-            creator=row['Creator'],
-            additional_info=row['AdditionalInfo'] or '',
-            creation_date=row['CreationDate'],
-            editors=row['Editors'],
-            last_modified=row['LastModified'],
-            version=row.get('Version', 1),
-            is_active=bool(row.get('IsActive', 1))
+            task_id=task_id,
+            title=title,
+            status=status,
+            person_in_charge=person_in_charge,
+            due_date=due_date,
+            creator=creator,
+            additional_info=additional_info or '',
+            creation_date=creation_date,
+            editors=editors,
+            last_modified=last_modified,
+            version=version,
+            is_active=bool(is_active)
         )
     
     def __str__(self) -> str:
@@ -176,6 +244,110 @@ class Task:
                 f"due_date='{self.due_date}', assigned_to={self.person_in_charge})")
 
 
+# Explicit column list; the order is what Task.from_db_row unpacks
+_TASK_COLUMNS = (
+    "ID", "Title", "Status", "PersonInCharge", "CreationDate", "DueDate", "Creator",
+    "Editors", "AdditionalInfo", "LastModified", "Version", "IsActive"
+)
+_TASK_SELECT = f"SELECT {', '.join(_TASK_COLUMNS)} FROM KANBAN"
+
+# CreationDate, LastModified, Version and IsActive come from the column DEFAULTs
+_TASK_INSERT_SQL = """
+    INSERT INTO KANBAN (Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    """Serialize _TASK_SELECT rows like Task.to_dict() without building Task objects"""
+    return [
+        {
+            'task_id': task_id,
+            'title': title,
+            'status': status,
+            'person_in_charge': person_in_charge,
+            'due_date': due_date,
+            'creator': creator,
+            'additional_info': additional_info or '',
+            'creation_date': creation_date,
+            'last_modified': last_modified,
+            'is_active': bool(is_active)
+        }
+        for (task_id, title, status, person_in_charge, creation_date, due_date,
+             creator, _editors, additional_info, last_modified, _version, is_active) in rows
+    ]
+
+# Every status with its active-task count, zero included, in one query
+_COUNT_BY_STATUS_SQL = f"""
+    SELECT s.Status AS Status, COUNT(k.ID) AS count
+    FROM ({" UNION ALL ".join(f"SELECT '{status.value}' AS Status" for status in TaskStatus)}) s
+    LEFT JOIN KANBAN k ON k.Status = s.Status AND k.IsActive = 1
+    GROUP BY s.Status
+"""
+
+# Updatable task fields mapped to their KANBAN columns
+_TASK_UPDATE_COLUMNS = {
+    'title': 'Title',
+    'status': 'Status',
+    'person_in_charge': 'PersonInCharge',
+    'due_date': 'DueDate',
+    'additional_info': 'AdditionalInfo',
+    'editors': 'Editors',
+    'is_active': 'IsActive',
+}
+_TASK_SEARCH_FIELDS = ('Title', 'AdditionalInfo')
+
+# Updatable user fields mapped to their USER columns
+_USER_UPDATE_COLUMNS = {
+    'name': 'Name',
+    'position': 'Position',
+    'is_active': 'IsActive',
+}
+
+
+def _all_tasks_sql(include_inactive: bool) -> str:
+    """Build the full-board listing shared by iter_tasks and get_tasks_as_dicts"""
+    where = "" if include_inactive else " WHERE IsActive = 1"
+    return f"{_TASK_SELECT}{where} ORDER BY DueDate ASC, LastModified DESC"
+
+
+@lru_cache(maxsize=None)
+def _task_update_sql(fields: Tuple[str, ...]) -> str:
+    """Build (once per field combination) the UPDATE statement for update_task"""
+    set_clause = ", ".join(f"{_TASK_UPDATE_COLUMNS[field]} = ?" for field in fields)
+    return (f"UPDATE KANBAN SET {set_clause}, LastModified = CURRENT_TIMESTAMP, "
+            f"Version = Version + 1 WHERE ID = ?")
+
+
+@lru_cache(maxsize=None)
+def _task_search_sql(fields: Tuple[str, ...]) -> str:
+    """Build (once per field combination) the SELECT statement for search_tasks"""
+    conditions = " OR ".join(f"{field} LIKE ?" for field in fields)
+    return f"""
+        {_TASK_SELECT}
+        WHERE ({conditions}) AND IsActive = 1
+        ORDER BY DueDate ASC
+    """
+
+
+# CROSS JOIN pins the join order: FTS index first, then KANBAN rows by ID
+_TASK_FTS_SEARCH_SQL = f"""
+    SELECT {', '.join('k.' + column for column in _TASK_COLUMNS)}
+    FROM kanban_fts CROSS JOIN KANBAN k ON k.ID = kanban_fts.rowid
+    WHERE kanban_fts MATCH ? AND k.IsActive = 1
+    ORDER BY k.DueDate ASC
+"""
+
+
+def _fts_query(search_term: str, fields: Tuple[str, ...]) -> Optional[str]:
+    """Translate a substring search into an FTS5 MATCH expression, or None if it cannot be"""
+    # Trigrams need at least three characters; LIKE wildcards have no FTS equivalent
+    if len(search_term) < 3 or '%' in search_term or '_' in search_term:
+        return None
+    phrase = search_term.replace('"', '""')
+    return f'{{{" ".join(fields)}}} : "{phrase}"'
+
+
 class DatabaseError(Exception):
     """Custom exception for database-related errors"""
     pass
@@ -197,43 +369,128 @@ class DatabaseConnectionManager:
         self.db_path = DatabaseConfig.DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._ensure_backup_dir()
+        
+        # Idle connections, most recently used first so hot page caches get reused
+        self._pool = queue.LifoQueue(maxsize=DatabaseConfig.POOL_SIZE)
+        self._pool_lock = threading.Lock()
+        self._open_connections = 0
+        self._wal_enabled = False
+        
+        # SQLite allows one writer at a time; queue writers here instead of
+        # letting them spin on SQLITE_BUSY while readers continue in WAL mode
+        self._write_lock = threading.Lock()
     
     def _ensure_backup_dir(self):
         """Ensure backup directory exists"""
         DatabaseConfig.DB_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open and configure a new database connection for the pool"""
+        connection = sqlite3.connect(
+            str(self.db_path),
+            timeout=DatabaseConfig.DEFAULT_TIMEOUT,
+            # Safe because the pool hands each connection to one caller at a time
+            check_same_thread=False,
+            # Autocommit: transactions are opened explicitly by get_connection
+            isolation_level=None,
+            cached_statements=DatabaseConfig.CACHED_STATEMENTS
+        )
+        # WAL mode is persistent in the database file, so only switch it once
+        if not self._wal_enabled:
+            mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            if mode.lower() != "wal":
+                connection.execute("PRAGMA journal_mode = WAL")
+            self._wal_enabled = True
+        connection.executescript(DatabaseConfig.CONNECTION_PRAGMAS)
+        connection.row_factory = sqlite3.Row  # Enable dictionary-like access
+        return connection
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection from the pool, opening one if the pool is not full"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._pool_lock:
+            can_open = self._open_connections < DatabaseConfig.POOL_SIZE
+            if can_open:
+                self._open_connections += 1
+        
+        if can_open:
+            try:
+                return self._create_connection()
+            except sqlite3.Error:
+                with self._pool_lock:
+                    self._open_connections -= 1
+                raise
+        
+        try:
+            return self._pool.get(timeout=DatabaseConfig.DEFAULT_TIMEOUT)
+        except queue.Empty:
+            raise DatabaseError("Timed out waiting for a database connection") from None
+    
+    def _checkin(self, connection: sqlite3.Connection):
+        """Return a connection to the pool with no transaction left open"""
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error as e:
+            # Unusable connection: drop it so a fresh one is opened later
+            logger.warning("Discarding pooled connection: %s", e)
+            connection.close()
+            with self._pool_lock:
+                self._open_connections -= 1
+            return
+        self._pool.put(connection)
+    
     @contextmanager
-    def get_connection(self) -> sqlite3.Connection:
+    def get_connection(self, write: bool = False) -> sqlite3.Connection:
         """
-        Context manager for database connections with automatic cleanup
+        Context manager for pooled database connections with automatic cleanup
+        
+        Args:
+            write: Hold the process-wide write lock and open a BEGIN IMMEDIATE
+                   transaction that is committed on exit; otherwise each
+                   statement runs in autocommit mode alongside other readers
         
         Yields:
             sqlite3.Connection: Database connection with proper configuration
         """
-        connection = None
         try:
-            connection = sqlite3.connect(
-                str(self.db_path),
-                timeout=DatabaseConfig.DEFAULT_TIMEOUT,
-                check_same_thread=False
-            )
-            # Enable foreign keys and performance optimizations
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA journal_mode = WAL")
-            connection.execute("PRAGMA synchronous = NORMAL")
-            connection.row_factory = sqlite3.Row  # Enable dictionary-like access
-            
+            connection = self._checkout()
+        except sqlite3.Error as e:
+            logger.error("Database connection error: %s", e)
+            raise DatabaseError(f"Database operation failed: {e}") from e
+        
+        if write:
+            self._write_lock.acquire()
+        try:
+            if write:
+                # Take SQLite's write lock up front instead of upgrading mid-transaction
+                connection.execute("BEGIN IMMEDIATE")
             yield connection
-            connection.commit()  # Auto-commit on successful exit
+            connection.commit()  # Commit on successful exit (no-op outside a transaction)
             
         except sqlite3.Error as e:
-            if connection:
-                connection.rollback()  # Rollback on error
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise DatabaseError(f"Database operation failed: {e}") from e
         finally:
-            if connection:
-                connection.close()
+            # Uncommitted work (error paths) is rolled back before reuse
+            self._checkin(connection)
+            if write:
+                self._write_lock.release()
+    
+    def close_all(self):
+        """Close every idle pooled connection (call at shutdown)"""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+            with self._pool_lock:
+                self._open_connections -= 1
     
     def backup_database(self) -> bool:
         """Create a timestamped backup of the database"""
@@ -245,14 +502,33 @@ class DatabaseConnectionManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = DatabaseConfig.DB_BACKUP_DIR / f"kanban_backup_{timestamp}.db"
             
-            with self.get_connection() as conn:
-                with sqlite3.connect(str(backup_path)) as backup_conn:
-                    conn.backup(backup_conn)
+            # A dedicated read-only source keeps the pool free, and copying in
+            # small steps lets writers get in between them
+            source = sqlite3.connect(
+                self.db_path.resolve().as_uri() + "?mode=ro",
+                uri=True,
+                timeout=DatabaseConfig.DEFAULT_TIMEOUT
+            )
+            try:
+                target = sqlite3.connect(str(backup_path))
+                try:
+                    source.backup(
+                        target,
+                        pages=DatabaseConfig.BACKUP_PAGES_PER_STEP,
+                        progress=lambda status, remaining, total: logger.debug(
+                            "Backup progress: %s/%s pages", total - remaining, total
+                        ),
+                        sleep=0.05
+                    )
+                finally:
+                    target.close()
+            finally:
+                source.close()
             
-            logger.info(f"Database backup created: {backup_path}")
+            logger.info("Database backup created: %s", backup_path)
             return True
         except Exception as e:
-            logger.error(f"Backup failed: {e}")
+            logger.error("Backup failed: %s", e)
             return False
 
 
@@ -265,11 +541,12 @@ class KanbanRepository:
     def __init__(self, connection_manager: DatabaseConnectionManager = None):
         self.connection_manager = connection_manager or DatabaseConnectionManager()
         self._initialized = False
+        self._search_index = None  # Whether kanban_fts exists; looked up on first search
     
     def initialize_database(self) -> bool:
         """Initialize database with tables and indexes"""
         try:
-            with self.connection_manager.get_connection() as conn:
+            with self.connection_manager.get_connection(write=True) as conn:
                 # Create kanban table
                 conn.execute(DatabaseConfig.KANBAN_TABLE_SCHEMA)
                 
@@ -278,7 +555,23 @@ class KanbanRepository:
                     try:
                         conn.execute(index_sql)
                     except sqlite3.Error as e:
-                        logger.warning(f"Index creation warning: {e}")
+                        logger.warning("Index creation warning: %s", e)
+                
+                self._create_search_index(conn)
+                
+                # Rows stamped from Python before LastModified moved to CURRENT_TIMESTAMP
+                # hold local 'YYYY-MM-DDTHH:MM:SS.ffffff'; rewrite them once as UTC
+                # 'YYYY-MM-DD HH:MM:SS' so LastModified orders correctly as text
+                conn.execute("""
+                    UPDATE KANBAN SET LastModified = datetime(LastModified, 'utc')
+                    WHERE LastModified LIKE '____-__-__T%'
+                """)
+                
+                # Collect planner statistics once; afterwards only refresh them when stale
+                has_stats = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+                ).fetchone()
+                conn.execute("PRAGMA optimize" if has_stats else "ANALYZE KANBAN")
                 
                 conn.commit()
                 logger.info("Kanban database initialized successfully")
@@ -286,9 +579,32 @@ class KanbanRepository:
                 return True
                 
         except sqlite3.Error as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error("Database initialization failed: %s", e)
             raise DatabaseError(f"Failed to initialize database: {e}") from e
     
+    def _create_search_index(self, conn: sqlite3.Connection):
+        """Create the FTS5 search index, filling it from existing tasks on first creation"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'kanban_fts'"
+        ).fetchone()
+        try:
+            for statement in DatabaseConfig.SEARCH_INDEX_SCHEMA:
+                conn.execute(statement)
+            if not exists:
+                conn.execute("INSERT INTO kanban_fts(kanban_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5/trigram: search_tasks falls back to LIKE
+            logger.warning("Search index unavailable: %s", e)
+        self._search_index = None
+    
+    def _has_search_index(self, conn: sqlite3.Connection) -> bool:
+        """Check (once per repository) whether the FTS5 search index exists"""
+        if self._search_index is None:
+            self._search_index = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'kanban_fts'"
+            ).fetchone() is not None
+        return self._search_index
+    
     def add_task(self, title: str, status: str, person_in_charge: int, 
                  due_date: str, creator: int, additional_info: str = "") -> int:
         """
@@ -309,39 +625,20 @@ class KanbanRepository:
             DatabaseError: If database operation fails
             ValueError: If task data is invalid
         """
-        # Validate inputs
-        if not title or not title.strip():
-            raise ValueError("Task title cannot be empty")
-        
-        if len(title.strip()) > 200:
-            raise ValueError("Task title cannot exceed 200 characters")
-        
-        if not TaskStatus.is_valid_status(status):
-            valid_statuses = TaskStatus.get_valid_statuses()
-            raise ValueError(f"Invalid status: {status}. Must be one of {valid_statuses}")
-        
-        if not isinstance(person_in_charge, int) or person_in_charge <= 0:
-            raise ValueError("Person in charge must be a positive integer")
-        
-        if not isinstance(creator, int) or creator <= 0:
-            raise ValueError("Creator must be a positive integer")
-        
-        if not self._is_valid_date_format(due_date):
-            raise ValueError("Due date must be in YYYY-MM-DD format")
+        # Same checks as Task.validate, without building a Task (first error wins)
+        errors = _task_field_errors(title, status, person_in_charge, creator, due_date)
+        if errors:
+            raise ValueError(errors[0])
         
         try:
-            with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO KANBAN 
-                    (Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo, LastModified)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            with self.connection_manager.get_connection(write=True) as conn:
+                cursor = conn.execute(_TASK_INSERT_SQL, (
                     title.strip(), status, person_in_charge, due_date,
-                    creator, additional_info, datetime.now().isoformat()
+                    creator, additional_info
                 ))
                 
                 task_id = cursor.lastrowid
-                logger.info(f"Task added successfully: {title} (ID: {task_id})")
+                logger.info("Task added successfully: %s (ID: %s)", title, task_id)
                 return task_id
                 
         except sqlite3.IntegrityError as e:
@@ -353,6 +650,50 @@ class KanbanRepository:
             logger.error(error_msg)
             raise DatabaseError(error_msg) from e
     
+    def add_tasks(self, tasks: List[Task]) -> List[int]:
+        """
+        Add several tasks with one executemany in a single transaction
+        
+        Args:
+            tasks: Tasks to insert; task_id, creation date and version are assigned by the database
+            
+        Returns:
+            List[int]: IDs of the new tasks, in input order
+            
+        Raises:
+            DatabaseError: If database operation fails (nothing is inserted)
+            ValueError: If any task is invalid (nothing is inserted)
+        """
+        tasks = list(tasks)
+        for task in tasks:
+            errors = task.validate()
+            if errors:
+                raise ValueError(errors[0])
+        
+        if not tasks:
+            return []
+        
+        rows = (
+            (task.title.strip(), task.status, task.person_in_charge, task.due_date,
+             task.creator, task.additional_info)
+            for task in tasks
+        )
+        
+        try:
+            with self.connection_manager.get_connection(write=True) as conn:
+                conn.executemany(_TASK_INSERT_SQL, rows)
+                
+                # AUTOINCREMENT IDs are consecutive within one write transaction
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                task_ids = list(range(last_id - len(tasks) + 1, last_id + 1))
+                logger.info("%s tasks added (IDs %s-%s)", len(tasks), task_ids[0], last_id)
+                return task_ids
+                
+        except sqlite3.Error as e:
+            error_msg = f"Failed to add tasks: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from e
+    
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
         Retrieve a task by its ID
@@ -366,7 +707,7 @@ class KanbanRepository:
         try:
             with self.connection_manager.get_connection() as conn:
                 cursor = conn.execute(
-                    "SELECT * FROM KANBAN WHERE ID = ? AND IsActive = 1", 
+                    f"{_TASK_SELECT} WHERE ID = ? AND IsActive = 1",
                     (task_id,)
                 )
                 row = cursor.fetchone()
@@ -376,7 +717,7 @@ class KanbanRepository:
                 return None
                 
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving task {task_id}: {e}")
+            logger.error("Error retrieving task %s: %s", task_id, e)
             return None
     
     def get_all_tasks(self, include_inactive: bool = False) -> List[Task]:
@@ -389,31 +730,53 @@ class KanbanRepository:
         Returns:
             List[Task]: List of all tasks
         """
+        try:
+            return list(self.iter_tasks(include_inactive))
+        except DatabaseError as e:
+            logger.error("Error retrieving tasks: %s", e)
+            return []
+    
+    def iter_tasks(self, include_inactive: bool = False) -> Iterator[Task]:
+        """
+        Stream all tasks row by row instead of building a list
+        
+        The pooled connection is held until the iterator is exhausted or closed.
+        
+        Args:
+            include_inactive: Whether to include inactive tasks
+            
+        Yields:
+            Tasks ordered by due date, most recently modified first
+        """
+        return self._iter_tasks(_all_tasks_sql(include_inactive))
+    
+    def get_tasks_as_dicts(self, include_inactive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retrieve all tasks as Task.to_dict()-style dictionaries for display
+        
+        Skips building Task objects; use get_all_tasks when tasks will be modified.
+        
+        Args:
+            include_inactive: Whether to include inactive tasks
+            
+        Returns:
+            List of task dictionaries in get_all_tasks order
+        """
         try:
             with self.connection_manager.get_connection() as conn:
-                query = "SELECT * FROM KANBAN"
-                if not include_inactive:
-                    query += " WHERE IsActive = 1"
-                
-                query += " ORDER BY DueDate ASC, LastModified DESC"
-                
-                cursor = conn.execute(query)
-                tasks = []
-                
-                for row in cursor:
-                    try:
-                        task = Task.from_db_row(row)
-                        tasks.append(task)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Skipping invalid task data: {e}")
-                        continue
-                
-                return tasks
-                
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving tasks: {e}")
+                return rows_to_dicts(conn.execute(_all_tasks_sql(include_inactive)))
+        except DatabaseError as e:
+            # get_connection re-raises sqlite3 errors as DatabaseError
+            logger.error("Error retrieving tasks: %s", e)
             return []
     
+    def _iter_tasks(self, query: str, params: Tuple = ()) -> Iterator[Task]:
+        """Yield a Task per row of a _TASK_SELECT query on a pooled connection"""
+        from_db_row = Task.from_db_row
+        with self.connection_manager.get_connection() as conn:
+            for row in conn.execute(query, params):
+                yield from_db_row(row)
+    
     def update_task(self, task_id: int, **updates) -> bool:
         """
         Update task fields with partial updates
@@ -429,12 +792,9 @@ class KanbanRepository:
             logger.warning("No updates provided for task update")
             return True  # No updates needed
         
-        valid_fields = {'title', 'status', 'person_in_charge', 'due_date', 
-                       'additional_info', 'editors', 'is_active'}
-        
         # Validate update fields
         for field in updates.keys():
-            if field not in valid_fields:
+            if field not in _TASK_UPDATE_COLUMNS:
                 raise ValueError(f"Invalid field for update: {field}")
         
         # Special validation for status
@@ -442,28 +802,23 @@ class KanbanRepository:
             raise ValueError(f"Invalid status: {updates['status']}")
         
         try:
-            with self.connection_manager.get_connection() as conn:
-                set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
-                set_clause += ", LastModified = ?, Version = Version + 1"
-                
-                values = list(updates.values())
-                values.append(datetime.now().isoformat())
+            with self.connection_manager.get_connection(write=True) as conn:
+                # Sorted so each field combination maps to one cached statement
+                fields = tuple(sorted(updates))
+                values = [updates[field] for field in fields]
                 values.append(task_id)
                 
-                cursor = conn.execute(
-                    f"UPDATE KANBAN SET {set_clause} WHERE ID = ?",
-                    values
-                )
+                cursor = conn.execute(_task_update_sql(fields), values)
                 
                 if cursor.rowcount == 0:
-                    logger.warning(f"Task {task_id} not found for update")
+                    logger.warning("Task %s not found for update", task_id)
                     return False
                 
-                logger.info(f"Task {task_id} updated successfully")
+                logger.info("Task %s updated successfully", task_id)
                 return True
                 
         except sqlite3.Error as e:
-            logger.error(f"Error updating task {task_id}: {e}")
+            logger.error("Error updating task %s: %s", task_id, e)
             return False
     
     def delete_task(self, task_id: int, soft_delete: bool = True) -> bool:
@@ -478,33 +833,73 @@ class KanbanRepository:
             bool: True if deletion successful, False otherwise
         """
         try:
-            with self.connection_manager.get_connection() as conn:
-                # First verify task exists
-                task = self.get_task_by_id(task_id)
-                if not task:
-                    logger.warning(f"Task {task_id} not found for deletion")
-                    return False
-                
+            with self.connection_manager.get_connection(write=True) as conn:
+                # Only active tasks can be deleted; rowcount doubles as the existence check
                 if soft_delete:
                     # Soft delete (mark as inactive)
                     cursor = conn.execute(
-                        "UPDATE KANBAN SET IsActive = 0, LastModified = ? WHERE ID = ?",
-                        (datetime.now().isoformat(), task_id)
+                        "UPDATE KANBAN SET IsActive = 0, LastModified = CURRENT_TIMESTAMP "
+                        "WHERE ID = ? AND IsActive = 1",
+                        (task_id,)
                     )
                 else:
                     # Hard delete (permanent removal)
-                    cursor = conn.execute("DELETE FROM KANBAN WHERE ID = ?", (task_id,))
+                    cursor = conn.execute(
+                        "DELETE FROM KANBAN WHERE ID = ? AND IsActive = 1", (task_id,)
+                    )
                 
-                if cursor.rowcount > 0:
-                    action = "soft deleted" if soft_delete else "permanently deleted"
-                    logger.info(f"Task {action}: {task.title} (ID: {task_id})")
-                    return True
-                return False
+                if cursor.rowcount == 0:
+                    logger.warning("Task %s not found for deletion", task_id)
+                    return False
+                
+                action = "soft deleted" if soft_delete else "permanently deleted"
+                logger.info("Task %s (ID: %s)", action, task_id)
+                return True
                 
         except sqlite3.Error as e:
-            logger.error(f"Error deleting task {task_id}: {e}")
+            logger.error("Error deleting task %s: %s", task_id, e)
             return False
     
+    def delete_tasks(self, task_ids: List[int], soft_delete: bool = True) -> int:
+        """
+        Delete several tasks with a single statement (soft delete by default)
+        
+        Args:
+            task_ids: IDs of tasks to delete
+            soft_delete: If True, mark as inactive; if False, permanently delete
+            
+        Returns:
+            int: Number of tasks deleted
+        """
+        if not task_ids:
+            return 0
+        
+        # Like delete_task, only active tasks can be deleted
+        placeholders = ", ".join("?" * len(task_ids))
+        
+        try:
+            with self.connection_manager.get_connection(write=True) as conn:
+                if soft_delete:
+                    cursor = conn.execute(
+                        f"UPDATE KANBAN SET IsActive = 0, LastModified = CURRENT_TIMESTAMP "
+                        f"WHERE ID IN ({placeholders}) AND IsActive = 1",
+                        list(task_ids)
+                    )
+                else:
+                    cursor = conn.execute(
+                        f"DELETE FROM KANBAN WHERE ID IN ({placeholders}) AND IsActive = 1",
+                        list(task_ids)
+                    )
+                
+                action = "soft deleted" if soft_delete else "permanently deleted"
+                logger.info("%s task(s) %s: %s", cursor.rowcount, action, list(task_ids))
+                return cursor.rowcount
+                
+        except DatabaseError as e:
+            # get_connection re-raises sqlite3 errors as DatabaseError
+            logger.error("Error deleting tasks %s: %s", list(task_ids), e)
+            return 0
+    
     def get_tasks_by_status(self, status: str) -> List[Task]:
         """
         Get all tasks with a specific status
@@ -519,20 +914,12 @@ class KanbanRepository:
             raise ValueError(f"Invalid status: {status}")
         
         try:
-            with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM KANBAN WHERE Status = ? AND IsActive = 1 ORDER BY DueDate ASC",
-                    (status,)
-                )
-                
-                tasks = []
-                for row in cursor:
-                    tasks.append(Task.from_db_row(row))
-                
-                return tasks
-                
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving tasks by status {status}: {e}")
+            return list(self._iter_tasks(
+                f"{_TASK_SELECT} WHERE Status = ? AND IsActive = 1 ORDER BY DueDate ASC",
+                (status,)
+            ))
+        except DatabaseError as e:
+            logger.error("Error retrieving tasks by status %s: %s", status, e)
             return []
     
     def get_tasks_by_assignee(self, person_in_charge: int) -> List[Task]:
@@ -546,70 +933,39 @@ class KanbanRepository:
             List of tasks assigned to the person
         """
         try:
-            with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM KANBAN 
-                    WHERE PersonInCharge = ? AND IsActive = 1
-                    ORDER BY DueDate ASC, Status DESC
-                """, (person_in_charge,))
-                
-                tasks = []
-                for row in cursor:
-                    tasks.append(Task.from_db_row(row))
-                
-                return tasks
-                
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving tasks for assignee {person_in_charge}: {e}")
+            return list(self._iter_tasks(f"""
+                {_TASK_SELECT}
+                WHERE PersonInCharge = ? AND IsActive = 1
+                ORDER BY DueDate ASC, Status DESC
+            """, (person_in_charge,)))
+        except DatabaseError as e:
+            logger.error("Error retrieving tasks for assignee %s: %s", person_in_charge, e)
             return []
     
     def get_overdue_tasks(self) -> List[Task]:
         """Get all tasks that are overdue"""
         try:
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = date.today().isoformat()
             
-            with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM KANBAN 
-                    WHERE DueDate < ? AND Status != 'Finished' AND IsActive = 1
-                    ORDER BY DueDate ASC
-                """, (today,))
-                
-                tasks = []
-                for row in cursor:
-                    tasks.append(Task.from_db_row(row))
-                
-                return tasks
-                
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving overdue tasks: {e}")
+            return list(self._iter_tasks(f"""
+                {_TASK_SELECT}
+                WHERE DueDate < ? AND Status != 'Finished' AND IsActive = 1
+                ORDER BY DueDate ASC
+            """, (today,)))
+        except DatabaseError as e:
+            logger.error("Error retrieving overdue tasks: %s", e)
             return []
     
     def count_tasks_by_status(self) -> Dict[str, int]:
         """Count tasks grouped by status"""
         try:
             with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT Status, COUNT(*) as count 
-                    FROM KANBAN 
-                    WHERE IsActive = 1
-                    GROUP BY Status
-                """)
-                
-                counts = {}
-                for row in cursor:
-                    counts[row['Status']] = row['count']
-                
-                # Ensure all statuses are present
-                for status in TaskStatus.get_valid_statuses():
-                    if status not in counts:
-                        counts[status] = 0
-                
-                return counts
+                cursor = conn.execute(_COUNT_BY_STATUS_SQL)
+                return {status: count for status, count in cursor}
                 
         except sqlite3.Error as e:
-            logger.error(f"Error counting tasks by status: {e}")
-            return {status: 0 for status in TaskStatus.get_valid_statuses()}
+            logger.error("Error counting tasks by status: %s", e)
+            return dict.fromkeys(_ALL_STATUSES, 0)
     
     def count_tasks_by_person(self) -> Dict[int, int]:
         """Count tasks grouped by assignee"""
@@ -625,9 +981,40 @@ class KanbanRepository:
                 return {row['PersonInCharge']: row['count'] for row in cursor}
                 
         except sqlite3.Error as e:
-            logger.error("Error counting tasks by person: {e}")
+            logger.error("Error counting tasks by person: %s", e)
             return {}
     
+    def count_tasks_for_advice(self) -> Tuple[Dict[str, int], Dict[int, int]]:
+        """Count tasks by status and by assignee in a single query"""
+        status_counts = dict.fromkeys(_ALL_STATUSES, 0)
+        person_counts = {}
+        
+        try:
+            with self.connection_manager.get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT 'status' as kind, Status as key, COUNT(*) as count
+                    FROM KANBAN
+                    WHERE IsActive = 1
+                    GROUP BY Status
+                    UNION ALL
+                    SELECT 'person', PersonInCharge, COUNT(*)
+                    FROM KANBAN
+                    WHERE IsActive = 1
+                    GROUP BY PersonInCharge
+                """)
+                
+                for row in cursor:
+                    if row['kind'] == 'status':
+                        status_counts[row['key']] = row['count']
+                    else:
+                        person_counts[row['key']] = row['count']
+                
+        except DatabaseError as e:
+            # get_connection re-raises sqlite3 errors as DatabaseError
+            logger.error("Error counting tasks for advice: %s", e)
+        
+        return status_counts, person_counts
+    
     def search_tasks(self, search_term: str, search_fields: List[str] = None) -> List[Task]:
         """
         Search tasks by text in specified fields
@@ -639,109 +1026,156 @@ class KanbanRepository:
         Returns:
             List of matching tasks
         """
+        matches = self.iter_search_tasks(search_term, search_fields)
+        try:
+            return list(matches)
+        except DatabaseError as e:
+            logger.error("Error searching tasks: %s", e)
+            return []
+    
+    def iter_search_tasks(self, search_term: str, search_fields: List[str] = None) -> Iterator[Task]:
+        """
+        Stream tasks matching search_tasks' criteria row by row
+        
+        Search fields are checked immediately; the pooled connection is held
+        until the iterator is exhausted or closed.
+        
+        Args:
+            search_term: Text to search for
+            search_fields: Fields to search in (title, additional_info)
+            
+        Yields:
+            Matching tasks
+        """
         if not search_fields:
-            search_fields = ['Title', 'AdditionalInfo']
+            search_fields = _TASK_SEARCH_FIELDS
         
-        valid_fields = ['Title', 'AdditionalInfo']
         for field in search_fields:
-            if field not in valid_fields:
+            if field not in _TASK_SEARCH_FIELDS:
                 raise ValueError(f"Invalid search field: {field}")
         
-        try:
-            with self.connection_manager.get_connection() as conn:
-                # Build search conditions
-                conditions = " OR ".join([f"{field} LIKE ?" for field in search_fields])
-                search_pattern = f"%{search_term}%"
-                
-                cursor = conn.execute(f"""
-                    SELECT * FROM KANBAN 
-                    WHERE ({conditions}) AND IsActive = 1
-                    ORDER BY DueDate ASC
-                """, [search_pattern] * len(search_fields))
-                
-                tasks = []
-                for row in cursor:
-                    tasks.append(Task.from_db_row(row))
-                
-                return tasks
-                
-        except sqlite3.Error as e:
-            logger.error(f"Error searching tasks: {e}")
-            return []
+        return self._iter_search_tasks(search_term, tuple(search_fields))
     
-    def _is_valid_date_format(self, date_str: str) -> bool:
-        """Validate date format without throwing exceptions"""
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
+    def _iter_search_tasks(self, search_term: str, search_fields: Tuple[str, ...]) -> Iterator[Task]:
+        """Yield search matches, using the FTS5 index when the term allows it"""
+        fts_query = _fts_query(search_term, search_fields)
+        from_db_row = Task.from_db_row
+        
+        with self.connection_manager.get_connection() as conn:
+            if fts_query is not None and self._has_search_index(conn):
+                cursor = conn.execute(_TASK_FTS_SEARCH_SQL, (fts_query,))
+            else:
+                search_pattern = f"%{search_term}%"
+                cursor = conn.execute(
+                    _task_search_sql(search_fields),
+                    [search_pattern] * len(search_fields)
+                )
+            
+            for row in cursor:
+                yield from_db_row(row)
+
 
 class UserService:
     """Service for user-related operations with caching and enhanced security"""
     
     def __init__(self, connection_manager: DatabaseConnectionManager):
         self.connection_manager = connection_manager
-        self._user_cache = {}  # Cache for user information to reduce database queries
-        self._cache_ttl = timedelta(minutes=30)  # Cache time-to-live
-        self._last_cache_cleanup = datetime.now()
+        # Cache for user information to reduce database queries:
+        # phone number -> (expiry on the monotonic clock, user data), least recently used first
+        self._user_cache: OrderedDict = OrderedDict()
+        self._cache_ttl = 30 * 60  # Cache time-to-live in seconds
+        self._cache_max_size = 1024  # Least recently used entries are evicted beyond this
+        self._cache_lock = threading.Lock()
     
-    def get_user_by_phone(self, phone_number: int) -> Optional[Dict[str, Any]]:
+    def get_user_by_phone(self, phone_number: int,
+                          include_inactive: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get user information by phone number with caching support
         
         Args:
             phone_number: User's phone number
+            include_inactive: Also return deactivated users (bypasses the cache,
+                              which only holds active users)
             
         Returns:
             Dict with user information or None if not found
         """
-        # Check cache first
-        cache_key = f"user_{phone_number}"
-        if cache_key in self._user_cache:
-            cached_data = self._user_cache[cache_key]
-            if datetime.now() - cached_data['timestamp'] < self._cache_ttl:
-                return cached_data['data']
-            else:
-                # Cache expired
-                del self._user_cache[cache_key]
+        if include_inactive:
+            query = """
+                SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
+                FROM USER 
+                WHERE PhoneNo = ?
+            """
+        else:
+            # Check cache first
+            user_data = self._cached_user(phone_number)
+            if user_data is not None:
+                return user_data
+            
+            query = """
+                SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
+                FROM USER 
+                WHERE PhoneNo = ? AND IsActive = 1
+            """
         
         try:
             with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
-                    FROM USER 
-                    WHERE PhoneNo = ? AND IsActive = 1
-                """, (phone_number,))
-                
-                row = cursor.fetchone()
+                row = conn.execute(query, (phone_number,)).fetchone()
                 if row:
-                    user_data = {
-                        'user_id': row['ID'],
-                        'phone_no': row['PhoneNo'],
-                        'name': row['Name'],
-                        'position': row['Position'],
-                        'is_active': bool(row['IsActive']),
-                        'created_at': row['CreatedAt'],
-                        'last_modified': row['LastModified']
-                    }
+                    user_data = self._user_from_row(row)
                     
                     # Cache the result
-                    self._user_cache[cache_key] = {
-                        'data': user_data,
-                        'timestamp': datetime.now()
-                    }
-                    
-                    # Cleanup old cache entries periodically
-                    self._cleanup_cache()
-                    
+                    if user_data['is_active']:
+                        self._cache_user(phone_number, user_data)
                     return user_data
                 return None
                 
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving user {phone_number}: {e}")
+            logger.error("Error retrieving user %s: %s", phone_number, e)
             return None
     
+    def get_users_by_phones(self, phone_numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get several users at once, fetching cache misses with a single query
+        
+        Args:
+            phone_numbers: Phone numbers to look up
+            
+        Returns:
+            Dict mapping each found phone number to its user information
+        """
+        users = {}
+        missing = []
+        
+        for phone_number in set(phone_numbers):
+            user_data = self._cached_user(phone_number)
+            if user_data is not None:
+                users[phone_number] = user_data
+            else:
+                missing.append(phone_number)
+        
+        if not missing:
+            return users
+        
+        placeholders = ", ".join("?" * len(missing))
+        try:
+            with self.connection_manager.get_connection() as conn:
+                cursor = conn.execute(f"""
+                    SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
+                    FROM USER 
+                    WHERE PhoneNo IN ({placeholders}) AND IsActive = 1
+                """, missing)
+                
+                for row in cursor:
+                    user_data = self._user_from_row(row)
+                    users[row['PhoneNo']] = user_data
+                    self._cache_user(row['PhoneNo'], user_data)
+                
+        except DatabaseError as e:
+            logger.error("Error retrieving users %s: %s", missing, e)
+        
+        return users
+    
     def validate_user_credentials(self, phone_number: int, password: str) -> Optional[Dict[str, Any]]:
         """
         Validate user credentials with secure password checking
@@ -760,26 +1194,25 @@ class UserService:
                     FROM USER 
                     WHERE PhoneNo = ? AND IsActive = 1
                 """, (phone_number,))
-                
                 row = cursor.fetchone()
-                if row:
-                    # In a real implementation, use proper password hashing
-                    # For now, this is a simplified version
-                    stored_hash = row['PasswordHash']
-                    if self._verify_password(password, stored_hash):
-                        return {
-                            'user_id': row['ID'],
-                            'phone_no': row['PhoneNo'],
-                            'name': row['Name'],
-                            'position': row['Position'],
-                            'is_active': bool(row['IsActive']),
-                            'created_at': row['CreatedAt']
-                        }
-                return None
                 
         except sqlite3.Error as e:
-            logger.error(f"Error validating credentials for {phone_number}: {e}")
+            logger.error("Error validating credentials for %s: %s", phone_number, e)
+            return None
+        
+        # Verify after the pooled connection has been returned, so a slow
+        # password hash never holds it
+        if not row or not self._verify_password(password, row['PasswordHash']):
             return None
+        
+        return {
+            'user_id': row['ID'],
+            'phone_no': row['PhoneNo'],
+            'name': row['Name'],
+            'position': row['Position'],
+            'is_active': bool(row['IsActive']),
+            'created_at': row['CreatedAt']
+        }
     
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -802,24 +1235,45 @@ class UserService:
         try:
             # Hash password before storage
             hashed_password = self._hash_password(user_data['password'])
+            # Same UTC format as CURRENT_TIMESTAMP, so the row need not be read back
+            timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
             
-            with self.connection_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO USER (PhoneNo, Name, Position, PasswordHash, IsActive, CreatedAt)
-                    VALUES (?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
-                """, (
-                    user_data['phone_no'],
-                    user_data['name'],
-                    user_data['position'],
-                    hashed_password
-                ))
+            with self.connection_manager.get_connection(write=True) as conn:
+                try:
+                    cursor = conn.execute("""
+                        INSERT INTO USER (PhoneNo, Name, Position, PasswordHash, IsActive, CreatedAt, LastModified)
+                        VALUES (?, ?, ?, ?, 1, ?, ?)
+                    """, (
+                        user_data['phone_no'],
+                        user_data['name'],
+                        user_data['position'],
+                        hashed_password,
+                        timestamp,
+                        timestamp
+                    ))
+                except sqlite3.IntegrityError:
+                    # The UNIQUE constraint on PhoneNo reports duplicates
+                    error_msg = f"User with phone {user_data['phone_no']} already exists"
+                    logger.error(error_msg)
+                    return {
+                        'success': False,
+                        'error': error_msg
+                    }
                 
                 user_id = cursor.lastrowid
                 
-                # Get the created user data
-                created_user = self.get_user_by_phone(user_data['phone_no'])
+                created_user = {
+                    'user_id': user_id,
+                    'phone_no': user_data['phone_no'],
+                    'name': user_data['name'],
+                    'position': user_data['position'],
+                    'is_active': True,
+                    'created_at': timestamp,
+                    'last_modified': timestamp
+                }
+                self._cache_user(user_data['phone_no'], created_user)
                 
-                logger.info(f"User created successfully: {user_data['name']} (ID: {user_id})")
+                logger.info("User created successfully: %s (ID: %s)", user_data['name'], user_id)
                 
                 return {
                     'success': True,
@@ -827,15 +1281,87 @@ class UserService:
                     'user_data': created_user
                 }
                 
-        except sqlite3.IntegrityError as e:
-            error_msg = f"User with phone {user_data['phone_no']} already exists"
+        except DatabaseError as e:
+            error_msg = f"Failed to create user: {e}"
             logger.error(error_msg)
             return {
                 'success': False,
                 'error': error_msg
             }
-        except sqlite3.Error as e:
-            error_msg = f"Failed to create user: {e}"
+    
+    def create_users(self, users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several user accounts in a single transaction
+        
+        Args:
+            users_data: List of dictionaries containing user information
+            
+        Returns:
+            Dictionary with creation result and the created users' information
+        """
+        required_fields = ['phone_no', 'name', 'position', 'password']
+        for user_data in users_data:
+            for field in required_fields:
+                if field not in user_data:
+                    return {
+                        'success': False,
+                        'error': f"Missing required field: {field}"
+                    }
+        
+        if not users_data:
+            return {'success': True, 'created': 0, 'users': []}
+        
+        rows = [
+            (
+                user_data['phone_no'],
+                user_data['name'],
+                user_data['position'],
+                self._hash_password(user_data['password'])
+            )
+            for user_data in users_data
+        ]
+        phone_numbers = [row[0] for row in rows]
+        
+        try:
+            with self.connection_manager.get_connection(write=True) as conn:
+                try:
+                    conn.executemany("""
+                        INSERT INTO USER (PhoneNo, Name, Position, PasswordHash, IsActive, CreatedAt)
+                        VALUES (?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+                    """, rows)
+                except sqlite3.IntegrityError as e:
+                    # All or nothing: undo the rows inserted before the failure
+                    conn.rollback()
+                    error_msg = f"Failed to create users, duplicate or invalid data: {e}"
+                    logger.error(error_msg)
+                    return {
+                        'success': False,
+                        'error': error_msg
+                    }
+                
+                placeholders = ", ".join("?" * len(phone_numbers))
+                cursor = conn.execute(f"""
+                    SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
+                    FROM USER 
+                    WHERE PhoneNo IN ({placeholders})
+                """, phone_numbers)
+                
+                created_users = []
+                for row in cursor:
+                    user_data = self._user_from_row(row)
+                    self._cache_user(row['PhoneNo'], user_data)
+                    created_users.append(user_data)
+                
+                logger.info("Created %s users", len(created_users))
+                
+                return {
+                    'success': True,
+                    'created': len(created_users),
+                    'users': created_users
+                }
+                
+        except DatabaseError as e:
+            error_msg = f"Failed to create users: {e}"
             logger.error(error_msg)
             return {
                 'success': False,
@@ -857,15 +1383,14 @@ class UserService:
             logger.warning("No updates provided for user update")
             return True
         
-        valid_fields = ['name', 'position', 'is_active']
         for field in updates.keys():
-            if field not in valid_fields:
-                logger.error(f"Invalid field for user update: {field}")
+            if field not in _USER_UPDATE_COLUMNS:
+                logger.error("Invalid field for user update: %s", field)
                 return False
         
         try:
-            with self.connection_manager.get_connection() as conn:
-                set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
+            with self.connection_manager.get_connection(write=True) as conn:
+                set_clause = ", ".join(f"{_USER_UPDATE_COLUMNS[field]} = ?" for field in updates.keys())
                 set_clause += ", LastModified = CURRENT_TIMESTAMP"
                 
                 values = list(updates.values())
@@ -878,16 +1403,14 @@ class UserService:
                 
                 if cursor.rowcount > 0:
                     # Clear cache for this user
-                    cache_key = f"user_{phone_number}"
-                    if cache_key in self._user_cache:
-                        del self._user_cache[cache_key]
+                    self._invalidate_user(phone_number)
                     
-                    logger.info(f"User {phone_number} updated successfully")
+                    logger.info("User %s updated successfully", phone_number)
                     return True
                 return False
                 
         except sqlite3.Error as e:
-            logger.error(f"Error updating user {phone_number}: {e}")
+            logger.error("Error updating user %s: %s", phone_number, e)
             return False
     
     def deactivate_user(self, phone_number: int) -> bool:
@@ -900,7 +1423,41 @@ class UserService:
         Returns:
             bool: True if deactivation successful, False otherwise
         """
-        return self.update_user(phone_number, {'is_active': 0})
+        return self.set_activation_status(phone_number, False)
+    
+    def set_activation_status(self, phone_number: int, is_active: bool) -> bool:
+        """
+        Activate or deactivate a user account
+        
+        Rows already in the requested state are not rewritten, so repeated
+        toggles cost no page writes.
+        
+        Args:
+            phone_number: User's phone number
+            is_active: Desired activation status
+            
+        Returns:
+            bool: True if the status changed, False if the user was not found
+                  or already had that status
+        """
+        status = int(bool(is_active))
+        try:
+            with self.connection_manager.get_connection(write=True) as conn:
+                cursor = conn.execute("""
+                    UPDATE USER SET IsActive = ?, LastModified = CURRENT_TIMESTAMP
+                    WHERE PhoneNo = ? AND IsActive <> ?
+                """, (status, phone_number, status))
+                changed = cursor.rowcount > 0
+                
+        except DatabaseError as e:
+            # get_connection re-raises sqlite3 errors as DatabaseError
+            logger.error("Error changing activation status for %s: %s", phone_number, e)
+            return False
+        
+        self._invalidate_user(phone_number)
+        if changed:
+            logger.info("User %s activation status set to %s", phone_number, status)
+        return changed
     
     def get_all_users(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """
@@ -913,36 +1470,37 @@ class UserService:
             List of user dictionaries
         """
         try:
-            with self.connection_manager.get_connection() as conn:
-                query = """
-                    SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
-                    FROM USER
-                """
-                if active_only:
-                    query += " WHERE IsActive = 1"
-                
-                query += " ORDER BY Name ASC"
-                
-                cursor = conn.execute(query)
-                users = []
-                
-                for row in cursor:
-                    users.append({
-                        'user_id': row['ID'],
-                        'phone_no': row['PhoneNo'],
-                        'name': row['Name'],
-                        'position': row['Position'],
-                        'is_active': bool(row['IsActive']),
-                        'created_at': row['CreatedAt'],
-                        'last_modified': row['LastModified']
-                    })
-                
-                return users
-                
+            return list(self.iter_all_users(active_only))
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving users: {e}")
+            logger.error("Error retrieving users: %s", e)
             return []
     
+    def iter_all_users(self, active_only: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all users row by row instead of building a list
+        
+        The pooled connection is held until the iterator is exhausted or closed.
+        
+        Args:
+            active_only: Whether to include only active users
+            
+        Yields:
+            User dictionaries ordered by name
+        """
+        query = """
+            SELECT ID, PhoneNo, Name, Position, IsActive, CreatedAt, LastModified
+            FROM USER
+        """
+        if active_only:
+            query += " WHERE IsActive = 1"
+        
+        query += " ORDER BY Name ASC"
+        
+        user_from_row = self._user_from_row
+        with self.connection_manager.get_connection() as conn:
+            for row in conn.execute(query):
+                yield user_from_row(row)
+    
     def user_exists(self, phone_number: int) -> bool:
         """
         Check if a user exists in the system
@@ -953,7 +1511,20 @@ class UserService:
         Returns:
             bool: True if user exists, False otherwise
         """
-        return self.get_user_by_phone(phone_number) is not None
+        if self._cached_user(phone_number) is not None:
+            return True
+        
+        try:
+            with self.connection_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT 1 FROM USER WHERE PhoneNo = ? AND IsActive = 1 LIMIT 1",
+                    (phone_number,)
+                )
+                return cursor.fetchone() is not None
+                
+        except DatabaseError as e:
+            logger.error("Error checking user %s: %s", phone_number, e)
+            return False
     
     def get_user_display_name(self, phone_number: int) -> str:
         """
@@ -970,6 +1541,15 @@ class UserService:
             return f"{user_data['name']} ({phone_number})"
         return f"Unknown User ({phone_number})"
     
+    def get_user_display_names(self, phone_numbers: List[int]) -> Dict[int, str]:
+        """Get formatted display names for several users with one lookup"""
+        users = self.get_users_by_phones(phone_numbers)
+        return {
+            phone_number: (f"{users[phone_number]['name']} ({phone_number})"
+                           if phone_number in users else f"Unknown User ({phone_number})")
+            for phone_number in phone_numbers
+        }
+    
     def search_users(self, search_term: str, search_fields: List[str] = None) -> List[Dict[str, Any]]:
         """
         Search users by text in specified fields
@@ -1016,7 +1596,7 @@ class UserService:
                 return users
                 
         except sqlite3.Error as e:
-            logger.error(f"Error searching users: {e}")
+            logger.error("Error searching users: %s", e)
             return []
     
     def _hash_password(self, password: str) -> str:
@@ -1050,22 +1630,44 @@ class UserService:
         # In production, use: bcrypt.checkpw(password.encode(), stored_hash.encode())
         return hashlib.sha256(password.encode()).hexdigest() == stored_hash
     
-    def _cleanup_cache(self):
-        """Clean up expired cache entries"""
-        now = datetime.now()
-        if now - self._last_cache_cleanup > timedelta(minutes=5):
-            expired_keys = []
-            for key, data in self._user_cache.items():
-                if now - data['timestamp'] > self._cache_ttl:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._user_cache[key]
-            
-            self._last_cache_cleanup = now
-            
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+    @staticmethod
+    def _user_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Build the user information dict from a USER row"""
+        return {
+            'user_id': row['ID'],
+            'phone_no': row['PhoneNo'],
+            'name': row['Name'],
+            'position': row['Position'],
+            'is_active': bool(row['IsActive']),
+            'created_at': row['CreatedAt'],
+            'last_modified': row['LastModified']
+        }
+    
+    def _cached_user(self, phone_number: int) -> Optional[Dict[str, Any]]:
+        """Return fresh cached user information, or None on a miss"""
+        with self._cache_lock:
+            entry = self._user_cache.get(phone_number)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                # Expired entries are evicted on access
+                del self._user_cache[phone_number]
+                return None
+            self._user_cache.move_to_end(phone_number)
+            return entry[1]
+    
+    def _cache_user(self, phone_number: int, user_data: Dict[str, Any]):
+        """Store user information in the cache, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._user_cache[phone_number] = (time.monotonic() + self._cache_ttl, user_data)
+            self._user_cache.move_to_end(phone_number)
+            if len(self._user_cache) > self._cache_max_size:
+                self._user_cache.popitem(last=False)
+    
+    def _invalidate_user(self, phone_number: int):
+        """Drop a user's cached information after a write"""
+        with self._cache_lock:
+            self._user_cache.pop(phone_number, None)
 
 
 class KanbanSystem:
@@ -1094,7 +1696,7 @@ class KanbanSystem:
             return True
             
         except Exception as e:
-            logger.error(f"System initialization failed: {e}")
+            logger.error("System initialization failed: %s", e)
             return False
     
     def add_task(self, title: str, status: str, person_in_charge: int, 
@@ -1104,6 +1706,10 @@ class KanbanSystem:
             title, status, person_in_charge, due_date, creator, additional_info
         )
     
+    def add_tasks(self, tasks: List[Task]) -> List[int]:
+        """Add several tasks in one transaction"""
+        return self.kanban_repo.add_tasks(tasks)
+    
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID"""
         return self.kanban_repo.get_task_by_id(task_id)
@@ -1112,6 +1718,10 @@ class KanbanSystem:
         """Get all tasks"""
         return self.kanban_repo.get_all_tasks(include_inactive)
     
+    def get_tasks_as_dicts(self, include_inactive: bool = False) -> List[Dict[str, Any]]:
+        """Get all tasks as serializable dictionaries"""
+        return self.kanban_repo.get_tasks_as_dicts(include_inactive)
+    
     def update_task(self, task_id: int, **updates) -> bool:
         """Update task fields"""
         return self.kanban_repo.update_task(task_id, **updates)
@@ -1120,9 +1730,17 @@ class KanbanSystem:
         """Delete a task"""
         return self.kanban_repo.delete_task(task_id, soft_delete)
     
-    def get_user(self, phone_number: int) -> Optional[Dict[str, Any]]:
+    def delete_tasks(self, task_ids: List[int], soft_delete: bool = True) -> int:
+        """Delete several tasks in one statement"""
+        return self.kanban_repo.delete_tasks(task_ids, soft_delete)
+    
+    def get_user(self, phone_number: int, include_inactive: bool = False) -> Optional[Dict[str, Any]]:
         """Get user information"""
-        return self.user_service.get_user_by_phone(phone_number)
+        return self.user_service.get_user_by_phone(phone_number, include_inactive)
+    
+    def get_users(self, phone_numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several users by phone number in one query"""
+        return self.user_service.get_users_by_phones(phone_numbers)
     
     def validate_login(self, phone_number: int, password: str) -> Optional[Dict[str, Any]]:
         """Validate user credentials"""
@@ -1132,6 +1750,18 @@ class KanbanSystem:
         """Create a new user"""
         return self.user_service.create_user(user_data)
     
+    def create_users(self, users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create several users in one transaction"""
+        return self.user_service.create_users(users_data)
+    
+    def change_activation_status(self, phone_number: int, is_active: bool) -> bool:
+        """Activate or deactivate a user"""
+        return self.user_service.set_activation_status(phone_number, is_active)
+    
+    def get_advice_counts(self) -> Tuple[Dict[str, int], Dict[int, int]]:
+        """Get task counts by status and by assignee for the advice screen"""
+        return self.kanban_repo.count_tasks_for_advice()
+    
     def get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
         try:
@@ -1150,7 +1780,7 @@ class KanbanSystem:
             }
             
         except Exception as e:
-            logger.error(f"Error generating system stats: {e}")
+            logger.error("Error generating system stats: %s", e)
             return {}
 
 
@@ -1186,11 +1816,27 @@ def GetUserByPhone(PhoneNo: int):
         return [user['name']]
     return None
 
+def GetUserInfo(PhoneNo: int):
+    """Legacy-style lookup of the full user dict, deactivated users included"""
+    system = KanbanSystem()
+    return system.get_user(PhoneNo, include_inactive=True)
+
+def GetUsersByPhones(PhoneNos):
+    """Legacy-style bulk lookup: {PhoneNo: [name]} for each user found"""
+    system = KanbanSystem()
+    users = system.get_users(list(PhoneNos))
+    return {phone: [user['name']] for phone, user in users.items()}
+
 def CheckUserExist(PhoneNo: int):
     """Legacy function for checking user existence"""
     system = KanbanSystem()
     return system.get_user(PhoneNo) is not None
 
+def ChangeActivationStatus(PhoneNo: int, Status):
+    """Legacy function for activating (1) or deactivating (0) a user"""
+    system = KanbanSystem()
+    return system.change_activation_status(PhoneNo, bool(int(Status)))
+
 def GetAllTasks():
     """Legacy function for getting all tasks"""
     system = KanbanSystem()
@@ -1207,9 +1853,8 @@ def CountTask():
     stats = system.get_system_stats()
     counts = stats.get('task_counts_by_status', {})
     
-    # Return in expected order
-    status_order = ['To-Do', 'In Progress', 'Waiting Review', 'Finished']
-    return [counts.get(status, 0) for status in status_order]
+    # Return in TaskStatus order
+    return [counts.get(status, 0) for status in _ALL_STATUSES]
 
 def CountTaskByPerson():
     """Legacy function for counting tasks by person"""
@@ -1217,6 +1862,14 @@ def CountTaskByPerson():
     stats = system.get_system_stats()
     return stats.get('task_counts_by_person', {})
 
+def GetAdvice():
+    """Legacy-style function returning (CountTask(), CountTaskByPerson()) in one query"""
+    system = KanbanSystem()
+    status_counts, person_counts = system.get_advice_counts()
+    
+    # status_counts is keyed in TaskStatus order, every status included
+    return list(status_counts.values()), person_counts
+
 
 def main():
     """Main function demonstrating system usage"""
@@ -1248,10 +1901,12 @@ def main():
         return 0
         
     except Exception as e:
-        logger.error(f"System error: {e}")
+        logger.error("System error: %s", e)
         print(f"Error: {e}")
         return 1
 
 
 if __name__ == "__main__":
+    # Logging is configured by the application, not on import
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     exit(main())
@@ -345,22 +345,22 @@ class SecurityService:
         
         return True
     
+    _PHONE_NUMBER_RE = re.compile(SystemConfig.PHONE_NUMBER_PATTERN)
+    
     def _validate_phone_number(self, phone_number: int) -> bool:
         """Validate phone number format"""
-        pattern = re.compile(SystemConfig.PHONE_NUMBER_PATTERN)
-        return bool(pattern.match(str(phone_number)))
+        return bool(self._PHONE_NUMBER_RE.match(str(phone_number)))
     
     def _validate_password_complexity(self, password: str) -> bool:
         """Validate password meets complexity requirements"""
         if len(password) < SystemConfig.PASSWORD_MIN_LENGTH:
             return False
         
-        # Check for uppercase, lowercase, and numbers
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        
-        return has_upper and has_lower and has_digit
+        # Check for uppercase, lowercase, and numbers; map() keeps each scan in C
+        # and the chained and stops at the first missing character class
+        return (any(map(str.isupper, password))
+                and any(map(str.islower, password))
+                and any(map(str.isdigit, password)))
     
     def _create_user_session(self, user_data: Dict[str, Any], ip_address: str) -> UserSession:
         """Create a new user session"""